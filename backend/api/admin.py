@@ -2,7 +2,8 @@ from django.contrib import admin
 from .models import (
     Project, Skill, About, Experience, Education, 
     Contact, Testimonial, SocialLink, 
-    Setting, Service, AdminRole, AdminUser, AdminInvitation
+    Setting, Service, AdminRole, AdminUser, AdminInvitation,
+    AnalyticsCounter, OutboxMessage
 )
 
 # Register your models here.
@@ -48,4 +49,16 @@ class AdminInvitationAdmin(admin.ModelAdmin):
     list_editable = ['status']
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('role', 'invited_by')
\ No newline at end of file
+        return super().get_queryset(request).select_related('role', 'invited_by')
+
+@admin.register(AnalyticsCounter)
+class AnalyticsCounterAdmin(admin.ModelAdmin):
+    list_display = ['metric', 'granularity', 'bucket', 'value', 'updated_at']
+    list_filter = ['metric', 'granularity']
+    readonly_fields = ['updated_at']
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ['event', 'channel', 'status', 'attempts', 'available_at', 'created_at', 'sent_at']
+    list_filter = ['status', 'channel', 'event']
+    readonly_fields = ['created_at', 'sent_at']
@@ -0,0 +1,267 @@
+# backend/api/analytics.py
+# Dashboard analytics backed by the AnalyticsCounter table.
+#
+# Counters are kept up to date from model signals (see api/signals.py), so
+# reading the dashboard costs a single small query no matter how many rows
+# the counted tables hold. compute_live_counts() recomputes everything from
+# the source tables in one round-trip and is used to (re)build the counters.
+#
+# The same table holds the hourly and daily rollups behind the time-series
+# API: rows created per bucket for TRACKED_MODELS, and saves/deletes per
+# bucket for CONTENT_MODELS ('<name>_changes', plus 'content_changes').
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import (
+    About,
+    AnalyticsCounter,
+    Contact,
+    Education,
+    Experience,
+    Project,
+    Service,
+    Setting,
+    Skill,
+    SocialLink,
+    Testimonial,
+)
+
+# Metric name -> counted model
+TRACKED_MODELS = {
+    'projects': Project,
+    'skills': Skill,
+    'experiences': Experience,
+    'contacts': Contact,
+    'testimonials': Testimonial,
+}
+
+# Content name -> model whose saves and deletes are counted as changes
+CONTENT_MODELS = {
+    'projects': Project,
+    'skills': Skill,
+    'experiences': Experience,
+    'about': About,
+    'educations': Education,
+    'testimonials': Testimonial,
+    'sociallinks': SocialLink,
+    'settings': Setting,
+    'services': Service,
+}
+ALL_CONTENT_CHANGES = 'content_changes'
+
+TIMESERIES_METRICS = (
+    list(TRACKED_MODELS)
+    + [f'{name}_changes' for name in CONTENT_MODELS]
+    + [ALL_CONTENT_CHANGES]
+)
+
+# Metrics reported as "recent activity" on the dashboard
+RECENT_METRICS = ('contacts', 'projects')
+RECENT_DAYS = 30
+
+TOTAL_BUCKET = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def day_bucket(value):
+    return value.astimezone(dt_timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def hour_bucket(value):
+    return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+BUCKETS = {
+    'day': (day_bucket, timedelta(days=1), TruncDay),
+    'hour': (hour_bucket, timedelta(hours=1), TruncHour),
+}
+
+
+def recent_since(now=None):
+    """Start of the recent-activity window: midnight UTC, RECENT_DAYS - 1 days ago."""
+    return day_bucket(now or timezone.now()) - timedelta(days=RECENT_DAYS - 1)
+
+
+def increment(metric, granularity, bucket, delta):
+    updated = AnalyticsCounter.objects.filter(
+        metric=metric, granularity=granularity, bucket=bucket
+    ).update(value=F('value') + delta)
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            AnalyticsCounter.objects.create(metric=metric, granularity=granularity, bucket=bucket, value=delta)
+    except IntegrityError:
+        # Created concurrently by another request
+        AnalyticsCounter.objects.filter(
+            metric=metric, granularity=granularity, bucket=bucket
+        ).update(value=F('value') + delta)
+
+
+def record_change(metric, instance, delta):
+    """Count a created (+1) or deleted (-1) row of a tracked model."""
+    increment(metric, 'total', TOTAL_BUCKET, delta)
+    if instance.created_at:
+        for granularity, (bucket, _, _) in BUCKETS.items():
+            increment(metric, granularity, bucket(instance.created_at), delta)
+
+
+def record_created(metric, instances):
+    """Count rows created together (e.g. by bulk_create, which sends no signals)."""
+    instances = [instance for instance in instances if instance.created_at]
+    if not instances:
+        return
+    increment(metric, 'total', TOTAL_BUCKET, len(instances))
+    for granularity, (bucket, _, _) in BUCKETS.items():
+        counts = Counter(bucket(instance.created_at) for instance in instances)
+        for value, count in counts.items():
+            increment(metric, granularity, value, count)
+
+
+def record_content_change(name, when=None):
+    """Count a save or delete of site content in the current hour and day."""
+    when = when or timezone.now()
+    for metric in (f'{name}_changes', ALL_CONTENT_CHANGES):
+        for granularity, (bucket, _, _) in BUCKETS.items():
+            increment(metric, granularity, bucket(when), 1)
+
+
+def compute_live_counts(since=None):
+    """Count every metric from the source tables in a single query."""
+    since = since or recent_since()
+    quote = connection.ops.quote_name
+    columns = []
+    params = []
+    for metric, model in TRACKED_MODELS.items():
+        table = quote(model._meta.db_table)
+        columns.append(f'(SELECT COUNT(*) FROM {table})')
+        if metric in RECENT_METRICS:
+            columns.append(f'(SELECT COUNT(*) FROM {table} WHERE {quote("created_at")} >= %s)')
+            params.append(connection.ops.adapt_datetimefield_value(since))
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT {", ".join(columns)}', params)
+        row = list(cursor.fetchone())
+
+    totals, recent = {}, {}
+    for metric in TRACKED_MODELS:
+        totals[metric] = row.pop(0)
+        if metric in RECENT_METRICS:
+            recent[metric] = row.pop(0)
+    return totals, recent
+
+
+def read_counters(since=None):
+    """Return (totals, recent) from the counters table, or None if it was never built."""
+    since = since or recent_since()
+    totals = {}
+    recent = {metric: 0 for metric in RECENT_METRICS}
+    counters = AnalyticsCounter.objects.filter(
+        Q(metric__in=list(TRACKED_MODELS), granularity='total')
+        | Q(metric__in=RECENT_METRICS, granularity='day', bucket__gte=since)
+    )
+    for metric, granularity, value in counters.values_list('metric', 'granularity', 'value'):
+        if granularity == 'total':
+            totals[metric] = value
+        else:
+            recent[metric] += value
+    if set(totals) != set(TRACKED_MODELS):
+        return None
+    return totals, recent
+
+
+@transaction.atomic
+def rebuild_counters(totals=None):
+    """Recompute all counters from the source tables."""
+    if totals is None:
+        totals, _ = compute_live_counts()
+    AnalyticsCounter.objects.filter(metric__in=list(TRACKED_MODELS)).delete()
+    counters = [
+        AnalyticsCounter(metric=metric, granularity='total', bucket=TOTAL_BUCKET, value=value)
+        for metric, value in totals.items()
+    ]
+    for metric, model in TRACKED_MODELS.items():
+        for granularity, (_, _, trunc) in BUCKETS.items():
+            counters.extend(
+                AnalyticsCounter(metric=metric, granularity=granularity, bucket=bucket, value=count)
+                for bucket, count in count_by_bucket(model.objects.all(), 'created_at', trunc)
+            )
+    AnalyticsCounter.objects.bulk_create(counters, batch_size=1000)
+
+
+def count_by_bucket(queryset, field, trunc):
+    rows = (
+        queryset.order_by()
+        .annotate(bucket=trunc(field, tzinfo=dt_timezone.utc))
+        .values('bucket')
+        .annotate(count=Count('id'))
+    )
+    return [(row['bucket'], row['count']) for row in rows]
+
+
+@transaction.atomic
+def backfill_content_changes():
+    """
+    Seed the '*_changes' rollups from the rows that exist.
+
+    Past edits aren't recorded anywhere, so each row contributes its
+    creation and, if it was edited since, its last update.
+    """
+    metrics = [f'{name}_changes' for name in CONTENT_MODELS] + [ALL_CONTENT_CHANGES]
+    AnalyticsCounter.objects.filter(metric__in=metrics).delete()
+    counts = {}
+    for name, model in CONTENT_MODELS.items():
+        fields = ['updated_at'] if model is About else ['created_at', 'updated_at']
+        for row in model.objects.values(*fields):
+            changes = {row[field] for field in fields}
+            # Saving a new row sets updated_at a moment after created_at
+            if len(changes) == 2 and row['updated_at'] - row['created_at'] < timedelta(seconds=1):
+                changes = {row['created_at']}
+            for changed_at in changes:
+                for granularity, (bucket, _, _) in BUCKETS.items():
+                    for metric in (f'{name}_changes', ALL_CONTENT_CHANGES):
+                        key = (metric, granularity, bucket(changed_at))
+                        counts[key] = counts.get(key, 0) + 1
+    AnalyticsCounter.objects.bulk_create(
+        [
+            AnalyticsCounter(metric=metric, granularity=granularity, bucket=bucket, value=count)
+            for (metric, granularity, bucket), count in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+def get_timeseries(metric, granularity, start, end):
+    """Return [(bucket, value), ...] for every bucket in [start, end), zero-filled."""
+    bucket, step, _ = BUCKETS[granularity]
+    values = dict(
+        AnalyticsCounter.objects.filter(
+            metric=metric, granularity=granularity, bucket__gte=bucket(start), bucket__lt=end
+        ).values_list('bucket', 'value')
+    )
+    points = []
+    current = bucket(start)
+    while current < end:
+        points.append((current, values.get(current, 0)))
+        current += step
+    return points
+
+
+def get_dashboard_counts(refresh=False):
+    """Return (totals, recent) for the dashboard.
+
+    Reads the counters table; when it is incomplete or ``refresh`` is set the
+    counts are computed from the source tables and the counters rebuilt.
+    """
+    since = recent_since()
+    if not refresh:
+        counts = read_counters(since)
+        if counts is not None:
+            return counts
+    totals, recent = compute_live_counts(since)
+    rebuild_counters(totals)
+    return totals, recent
@@ -0,0 +1,231 @@
+# backend/api/cache.py
+# Read-through caching for the public API.
+#
+# Every cached model has a revision counter stored in the configured cache
+# backend. Cache keys embed the current revision, so bumping the counter on
+# save/delete (see api/signals.py) makes stale entries unreachable without
+# having to track and delete them individually. The same revisions back the
+# ETag/Last-Modified validators used to answer conditional GETs with a 304.
+
+import hashlib
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .models import AdminRole, AdminUser
+
+logger = logging.getLogger(__name__)
+
+CACHE_TIMEOUT = getattr(settings, 'API_CACHE_TIMEOUT', 60 * 60 * 24)
+ADMIN_USER_CACHE_TIMEOUT = getattr(settings, 'ADMIN_USER_CACHE_TIMEOUT', 60)
+
+# Names of the views using CachedListMixin, used to report statistics.
+CACHED_VIEWS = set()
+
+
+def revision_key(model):
+    return f'api:revision:{model._meta.label_lower}'
+
+
+def modified_key(model):
+    return f'api:modified:{model._meta.label_lower}'
+
+
+def get_revision(model):
+    """Return the current content revision of a model."""
+    key = revision_key(model)
+    revision = cache.get(key)
+    if revision is None:
+        # Seed with a timestamp so a counter evicted from the cache never
+        # restarts at a value that was already used for older content.
+        revision = time.time_ns()
+        if not cache.add(key, revision, timeout=None):
+            revision = cache.get(key, revision)
+    return revision
+
+
+def bump_revision(model):
+    """Invalidate every cached response built from this model."""
+    cache.set(modified_key(model), time.time(), timeout=None)
+    key = revision_key(model)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        revision = time.time_ns()
+        cache.set(key, revision, timeout=None)
+        return revision
+
+
+def get_last_modified(model):
+    """Return the UNIX time the model's content last changed, or None."""
+    key = modified_key(model)
+    modified = cache.get(key)
+    if modified is None:
+        latest = model.objects.aggregate(latest=Max('updated_at'))['latest']
+        if latest is None:
+            return None
+        modified = latest.timestamp()
+        cache.add(key, modified, timeout=None)
+    return modified
+
+
+def get_cached_admin_user(firebase_uid):
+    """Return the AdminUser (with its role) for a Firebase UID, or None.
+
+    Lookups are shared across requests for ADMIN_USER_CACHE_TIMEOUT seconds
+    and invalidated whenever any AdminUser or AdminRole changes.
+    """
+    revisions = f'{get_revision(AdminUser)}.{get_revision(AdminRole)}'
+    key = f'api:admin-user:{revisions}:{firebase_uid}'
+    cached = cache.get(key)
+    if cached is not None:
+        return cached or None
+    admin_user = AdminUser.objects.select_related('role').filter(firebase_uid=firebase_uid).first()
+    # Cache misses too, as False, so unknown users don't query every time
+    cache.set(key, admin_user or False, ADMIN_USER_CACHE_TIMEOUT)
+    return admin_user
+
+
+def _stat_key(name, stat):
+    return f'api:stats:{name}:{stat}'
+
+
+def _incr_stat(name, stat, delta=1):
+    key = _stat_key(name, stat)
+    if not cache.add(key, delta, timeout=None):
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            cache.set(key, delta, timeout=None)
+
+
+def get_cache_stats():
+    """Return hit/miss counts and average fill time for every cached view."""
+    stats = {}
+    for name in sorted(CACHED_VIEWS):
+        values = cache.get_many([_stat_key(name, stat) for stat in ('hits', 'misses', 'fill_us')])
+        hits = values.get(_stat_key(name, 'hits'), 0)
+        misses = values.get(_stat_key(name, 'misses'), 0)
+        fill_us = values.get(_stat_key(name, 'fill_us'), 0)
+        total = hits + misses
+        stats[name] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else None,
+            'avg_fill_ms': round(fill_us / misses / 1000, 3) if misses else None,
+        }
+    return stats
+
+
+def cached_data(name, models, request, build, variant=''):
+    """Return ``(data, hit)`` for a cached response, calling ``build`` on a miss.
+
+    The key includes the scheme and host (serializers build absolute media
+    URLs from the request) and the revision of every model the data depends on.
+    """
+    revisions = '.'.join(str(get_revision(model)) for model in models)
+    variant_hash = hashlib.md5(variant.encode()).hexdigest() if variant else '-'
+    key = f'api:data:{name}:{request.scheme}://{request.get_host()}:{revisions}:{variant_hash}'
+
+    data = cache.get(key)
+    if data is not None:
+        _incr_stat(name, 'hits')
+        return data, True
+
+    started = time.perf_counter()
+    data = build()
+    elapsed_us = int((time.perf_counter() - started) * 1_000_000)
+    cache.set(key, data, CACHE_TIMEOUT)
+    _incr_stat(name, 'misses')
+    _incr_stat(name, 'fill_us', elapsed_us)
+    logger.debug('Cache fill for %s took %.2fms', name, elapsed_us / 1000)
+    return data, False
+
+
+class CachedListMixin:
+    """Serve ``list`` responses from the cache until the underlying model changes.
+
+    Set ``cache_models`` when the response depends on models other than the
+    queryset's own model.
+    """
+    cache_models = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        CACHED_VIEWS.add(cls.__name__)
+
+    def get_cache_models(self):
+        return self.cache_models or [self.queryset.model]
+
+    @staticmethod
+    def get_cacheable_data(response):
+        # A plain list, or a dict for paginated responses
+        data = response.data
+        return list(data) if isinstance(data, list) else dict(data)
+
+    def list(self, request, *args, **kwargs):
+        data, hit = cached_data(
+            self.__class__.__name__,
+            self.get_cache_models(),
+            request,
+            lambda: self.get_cacheable_data(super(CachedListMixin, self).list(request, *args, **kwargs)),
+            variant=request.GET.urlencode(),
+        )
+        response = Response(data)
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs with ``304 Not Modified`` before serializing.
+
+    The strong ETag is derived from the content revisions of
+    ``get_conditional_models()`` and the requested URL, so checking it costs a
+    cache lookup rather than a query. Only the ETag can answer a 304:
+    Last-Modified has one-second resolution, so an ``If-Modified-Since`` copy
+    could predate an edit made within the same second.
+    """
+    conditional_models = None
+
+    def get_conditional_models(self):
+        return self.conditional_models or [self.queryset.model]
+
+    def get_validators(self, request):
+        models = self.get_conditional_models()
+        revisions = '.'.join(str(get_revision(model)) for model in models)
+        source = f'{self.__class__.__name__}:{request.scheme}://{request.get_host()}:{request.get_full_path()}:{revisions}'
+        etag = f'"{hashlib.md5(source.encode()).hexdigest()}"'
+        modified = [value for value in (get_last_modified(model) for model in models) if value is not None]
+        # Rounded up, so the header is never earlier than the last edit
+        last_modified = math.ceil(max(modified)) if modified else None
+        return etag, last_modified
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        # Responses to authenticated requests must not be stored by shared caches
+        if 'HTTP_AUTHORIZATION' in request.META:
+            response['Cache-Control'] = 'private, no-cache'
+        else:
+            response['Cache-Control'] = 'no-cache'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
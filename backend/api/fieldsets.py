@@ -0,0 +1,76 @@
+# backend/api/fieldsets.py
+# Sparse fieldsets: ?fields=id,title returns only those fields and
+# ?omit=description returns all others.
+#
+# The selection is handed to the serializer through its context and pushed
+# down to the queryset with .only(), so unselected columns are never read
+# from the database.
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ListSerializer
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+READ_METHODS = ('GET', 'HEAD')
+
+
+def split_param(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+class SparseFieldsSerializerMixin:
+    """Limit a ModelSerializer's fields to ``context['fields']`` when it is set.
+
+    Only the outermost serializer is limited; nested serializers keep their
+    own fields.
+    """
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = self.context.get('fields')
+        parent = self.parent.parent if isinstance(self.parent, ListSerializer) else self.parent
+        if selected is None or parent is not None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+
+class SparseFieldsetsMixin:
+    """Support ``?fields=`` and ``?omit=`` on read requests of a generic view."""
+
+    def get_sparse_fields(self):
+        """Return the selected field names, or None to return every field."""
+        if hasattr(self, '_sparse_fields'):
+            return self._sparse_fields
+        self._sparse_fields = None
+        params = self.request.query_params
+        if self.request.method not in READ_METHODS or not (FIELDS_QUERY_PARAM in params or OMIT_QUERY_PARAM in params):
+            return None
+
+        available = list(self.get_serializer_class()(context={'request': self.request}).fields)
+        requested = split_param(params.get(FIELDS_QUERY_PARAM, '')) or available
+        omitted = split_param(params.get(OMIT_QUERY_PARAM, ''))
+        unknown = [name for name in requested + omitted if name not in available]
+        if unknown:
+            raise ValidationError({
+                'error': f"Unknown field(s): {', '.join(unknown)}",
+                'available_fields': available,
+            })
+        self._sparse_fields = [name for name in requested if name not in omitted]
+        return self._sparse_fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selected = self.get_sparse_fields()
+        if selected is None:
+            return queryset
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        # Keyset pagination reads its ordering fields from each row
+        needed = set(getattr(self.paginator, 'ordering', None) or ())
+        only = [name for name in selected if name in model_fields] + sorted(needed & model_fields)
+        return queryset.only(*only) if only else queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        selected = self.get_sparse_fields()
+        if selected is not None:
+            context['fields'] = selected
+        return context
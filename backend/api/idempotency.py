@@ -0,0 +1,133 @@
+# backend/api/idempotency.py
+# Idempotency-Key support for create endpoints.
+#
+# A client that retries a POST after a timeout can't tell whether the first
+# attempt went through. If it sends the same ``Idempotency-Key`` header with
+# each attempt, only the first one runs: its response (status and body) is
+# kept in the cache for IDEMPOTENCY_KEY_TTL seconds and replayed, with an
+# ``Idempotent-Replayed: true`` header, for every retry.
+#
+# A retry that arrives while the first attempt is still running waits for
+# it (up to IDEMPOTENCY_WAIT seconds) instead of creating a second row.
+# Reusing a key for a different request body is rejected with 422. Server
+# errors aren't kept, so the request can be retried with the same key.
+#
+# Keys are scoped to the view and the authenticated user. Responses are
+# kept in the "default" cache, which must be shared between workers (Redis
+# in production) for retries that reach another worker to be caught.
+
+import functools
+import hashlib
+import json
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import UploadedFile
+from rest_framework import status
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+# Responses not kept: conflicts and rate limiting are worth retrying
+UNCACHED_STATUSES = (status.HTTP_409_CONFLICT, status.HTTP_429_TOO_MANY_REQUESTS)
+# Response headers replayed along with the body
+REPLAYED_HEADERS = ('Location', 'Retry-After')
+# Seconds between checks while waiting for an attempt in progress
+POLL_INTERVAL = 0.05
+
+
+def fingerprint(request):
+    """Hash of the submitted data, so a key can't be reused for a different request."""
+    def default(value):
+        if isinstance(value, UploadedFile):
+            return {'name': value.name, 'size': value.size}
+        return str(value)
+
+    data = request.data
+    if hasattr(data, 'lists'):
+        data = {name: values for name, values in data.lists()}
+    body = json.dumps(data, sort_keys=True, default=default)
+    return hashlib.sha256(f'{request.method}:{request.path}:{body}'.encode()).hexdigest()
+
+
+def cache_keys(view, request, key):
+    user = getattr(request.user, 'pk', None) or 'anonymous'
+    scope = hashlib.sha256(f'{type(view).__name__}:{user}:{key}'.encode()).hexdigest()
+    return f'api:idempotency:{scope}', f'api:idempotency-lock:{scope}'
+
+
+def replay(stored):
+    response = Response(stored['data'], status=stored['status'], headers=stored['headers'])
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def mismatch():
+    return Response(
+        {'error': f'This {IDEMPOTENCY_HEADER} was already used for a different request.'},
+        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
+
+
+def idempotent(create):
+    """Make a view's create method honor the Idempotency-Key header."""
+    @functools.wraps(create)
+    def wrapped(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return create(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result_key, lock_key = cache_keys(self, request, key)
+        request_fingerprint = fingerprint(request)
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT
+        while True:
+            stored = cache.get(result_key)
+            if stored is not None:
+                return replay(stored) if stored['fingerprint'] == request_fingerprint else mismatch()
+            # Only one attempt per key runs at a time; the lock expires if its worker dies
+            if cache.add(lock_key, token, timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT):
+                break
+            if time.monotonic() >= deadline:
+                response = Response(
+                    {'error': f'A request with this {IDEMPOTENCY_HEADER} is still in progress.'},
+                    status=status.HTTP_409_CONFLICT,
+                )
+                response['Retry-After'] = '1'
+                return response
+            time.sleep(POLL_INTERVAL)
+
+        try:
+            # A previous attempt may have finished between the read and taking the lock
+            stored = cache.get(result_key)
+            if stored is not None:
+                return replay(stored) if stored['fingerprint'] == request_fingerprint else mismatch()
+            response = create(self, request, *args, **kwargs)
+            if response.status_code < 500 and response.status_code not in UNCACHED_STATUSES:
+                cache.set(result_key, {
+                    'fingerprint': request_fingerprint,
+                    'status': response.status_code,
+                    'data': getattr(response, 'data', None),
+                    'headers': {name: response[name] for name in REPLAYED_HEADERS if response.has_header(name)},
+                }, timeout=settings.IDEMPOTENCY_KEY_TTL)
+            return response
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+    return wrapped
+
+
+class IdempotentCreateMixin:
+    """Honor the Idempotency-Key header on a viewset's create action."""
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
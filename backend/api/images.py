@@ -0,0 +1,221 @@
+# backend/api/images.py
+# Responsive variants for uploaded images.
+#
+# When an image field gets a new file, its ``<field>_variants`` column is
+# marked pending, with the dimensions read from the image header, and once
+# the transaction commits a job is queued so the upload request returns
+# straight away. Jobs run on a small thread pool that reads the original
+# from storage and hands the Pillow work to a process pool (api/imaging.py),
+# then saves the resized AVIF/WebP variants next to the original and records
+# their names and sizes on the row, along with the image's dominant color
+# and a tiny placeholder to show while it loads.
+#
+# Set IMAGE_PROCESSING_ASYNC = False to process inline after the commit
+# instead. Rows left pending (e.g. by a restart) are picked up by the
+# process_images management command.
+
+import logging
+import multiprocessing
+import os
+import posixpath
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+
+from .cache import bump_revision
+from .imaging import read_dimensions, render_variants, supported_formats
+from .models import About, Experience, Project, Setting, Testimonial
+
+logger = logging.getLogger(__name__)
+
+# Model -> image fields that get variants
+IMAGE_FIELDS = {
+    Project: ('image',),
+    Experience: ('company_logo',),
+    About: ('profile_picture',),
+    Testimonial: ('image',),
+    Setting: ('site_logo', 'site_favicon'),
+}
+
+VARIANTS_DIR = 'variants'
+
+PENDING = 'pending'
+READY = 'ready'
+FAILED = 'failed'
+
+_executors = None
+_executors_pid = None
+_executors_lock = threading.Lock()
+
+
+def variants_field_name(field_name):
+    return f'{field_name}_variants'
+
+
+def get_executors():
+    """Return the ``(jobs, pillow)`` executors of this process, creating them on first use."""
+    global _executors, _executors_pid
+    with _executors_lock:
+        # Pools don't survive a fork (e.g. gunicorn --preload); start new ones
+        if _executors is None or _executors_pid != os.getpid():
+            workers = settings.IMAGE_PROCESSING_WORKERS
+            _executors = (
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix='images'),
+                # spawn: forking a process that runs threads isn't safe
+                ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')),
+            )
+            _executors_pid = os.getpid()
+        return _executors
+
+
+def variant_name(source, width, extension):
+    stem = posixpath.splitext(source)[0]
+    return posixpath.join(VARIANTS_DIR, f'{stem}-{width}w.{extension}')
+
+
+def variant_names(meta):
+    return [source['name'] for source in (meta or {}).get('sources', ())]
+
+
+def delete_files(storage, names):
+    if getattr(storage, 'content_addressed', False):
+        # Files may be shared between rows; collect_media removes unused ones
+        return
+    for name in names:
+        try:
+            storage.delete(name)
+        except OSError:
+            logger.warning('Could not delete image variant %s', name, exc_info=True)
+
+
+def process_image(model, pk, field_name, pool=None):
+    """Generate and record the variants of one image field of one row.
+
+    ``pool`` runs the Pillow work; without one it runs in this thread.
+    """
+    variants_field = variants_field_name(field_name)
+    instance = model.objects.filter(pk=pk).only(field_name, variants_field).first()
+    if instance is None:
+        return
+    file = getattr(instance, field_name)
+    source = file.name
+    if not source:
+        return
+    storage = file.storage
+    previous = variant_names(getattr(instance, variants_field))
+
+    formats = supported_formats(settings.IMAGE_VARIANT_FORMATS)
+    try:
+        with storage.open(source, 'rb') as original:
+            data = original.read()
+        args = (data, settings.IMAGE_VARIANT_WIDTHS, formats)
+        result = pool.submit(render_variants, *args).result() if pool else render_variants(*args)
+    except Exception as exc:
+        # Unreadable or unsupported (e.g. SVG) images keep being served as uploaded
+        logger.warning('Could not process %s: %s', source, exc)
+        meta = {'source': source, 'status': FAILED, 'error': str(exc)}
+    else:
+        sources = []
+        for variant in result['variants']:
+            name = storage.save(
+                variant_name(source, variant['width'], variant['format']),
+                ContentFile(variant['content']),
+            )
+            sources.append({
+                'type': variant['content_type'],
+                'width': variant['width'],
+                'height': variant['height'],
+                'name': name,
+            })
+        meta = {
+            'source': source,
+            'status': READY,
+            'width': result['width'],
+            'height': result['height'],
+            'color': result['color'],
+            'placeholder': result['placeholder'],
+            'sources': sources,
+        }
+
+    # Only record the result if the image wasn't replaced in the meantime
+    updated = model.objects.filter(pk=pk, **{field_name: source}).update(**{variants_field: meta})
+    if updated:
+        bump_revision(model)
+        delete_files(storage, [name for name in previous if name not in variant_names(meta)])
+    else:
+        delete_files(storage, variant_names(meta))
+
+
+def run_job(model, pk, field_name, stale, storage):
+    try:
+        if stale:
+            delete_files(storage, stale)
+        pool = get_executors()[1] if settings.IMAGE_PROCESSING_ASYNC else None
+        process_image(model, pk, field_name, pool=pool)
+    except Exception:
+        logger.exception('Image processing failed for %s %s.%s', model.__name__, pk, field_name)
+    finally:
+        if settings.IMAGE_PROCESSING_ASYNC:
+            # Job threads are long-lived; don't leave their connections open
+            connections.close_all()
+
+
+def schedule(model, pk, field_name, stale=(), storage=None):
+    """Process an image field once the current transaction commits."""
+    def enqueue():
+        if settings.IMAGE_PROCESSING_ASYNC:
+            get_executors()[0].submit(run_job, model, pk, field_name, stale, storage)
+        else:
+            run_job(model, pk, field_name, stale, storage)
+    transaction.on_commit(enqueue)
+
+
+def pending_meta(file):
+    """Variants value for a newly uploaded file, with its dimensions if they can be read."""
+    meta = {'source': file.name, 'status': PENDING}
+    # Only the header is read, so clients can reserve space before processing ends
+    try:
+        with file.storage.open(file.name, 'rb') as image:
+            dimensions = read_dimensions(image)
+    except OSError:
+        dimensions = None
+    if dimensions:
+        meta['width'], meta['height'] = dimensions
+    return meta
+
+
+def queue_changed_images(sender, instance, **kwargs):
+    """post_save: queue processing for image fields whose file changed."""
+    for field_name in IMAGE_FIELDS[sender]:
+        variants_field = variants_field_name(field_name)
+        if variants_field in instance.get_deferred_fields():
+            continue
+        file = getattr(instance, field_name)
+        meta = getattr(instance, variants_field) or {}
+        if (file.name or None) == meta.get('source'):
+            continue
+        stale = variant_names(meta)
+        meta = pending_meta(file) if file.name else {}
+        setattr(instance, variants_field, meta)
+        sender.objects.filter(pk=instance.pk).update(**{variants_field: meta})
+        if file.name:
+            schedule(sender, instance.pk, field_name, stale, file.storage)
+        elif stale:
+            transaction.on_commit(lambda storage=file.storage, names=stale: delete_files(storage, names))
+
+
+def delete_image_variants(sender, instance, **kwargs):
+    """pre_delete: remove the variant files of a row once its deletion commits."""
+    fields = IMAGE_FIELDS[sender]
+    # Read from the database: a job may have finished since the instance was loaded
+    metas = sender.objects.filter(pk=instance.pk).values_list(
+        *[variants_field_name(field_name) for field_name in fields]
+    ).first() or ()
+    for field_name, meta in zip(fields, metas):
+        names = variant_names(meta)
+        if names:
+            storage = sender._meta.get_field(field_name).storage
+            transaction.on_commit(lambda storage=storage, names=names: delete_files(storage, names))
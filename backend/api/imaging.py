@@ -0,0 +1,109 @@
+# backend/api/imaging.py
+# Pillow work for the image pipeline (see api/images.py).
+#
+# Runs in a worker process, so this module must not import Django: it takes
+# the original image as bytes and returns the encoded variants as bytes.
+
+import base64
+import io
+
+from PIL import ExifTags, Image, ImageOps, features
+
+# Encoder settings per output format, best compression first
+FORMATS = {
+    'avif': {'content_type': 'image/avif', 'save': {'quality': 60, 'speed': 6}},
+    'webp': {'content_type': 'image/webp', 'save': {'quality': 80, 'method': 4}},
+}
+
+# Longest side of the inline placeholder image, in pixels
+PLACEHOLDER_SIZE = 16
+# EXIF orientations that swap width and height
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def supported_formats(formats):
+    """Return the formats in ``formats`` this Pillow build can encode, in order."""
+    return [name for name in formats if name in FORMATS and features.check(name)]
+
+
+def read_dimensions(file):
+    """Return the displayed ``(width, height)`` of an image file, or None.
+
+    Only the header is read. EXIF orientation is taken into account, so a
+    portrait photo stored sideways reports portrait dimensions.
+    """
+    try:
+        with Image.open(file) as image:
+            width, height = image.size
+            if image.getexif().get(ExifTags.Base.Orientation) in TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
+            return width, height
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def dominant_color(image):
+    """Return the most common color of an image as ``#rrggbb``."""
+    if image.mode == 'RGBA':
+        # Judge transparent images by how they look on a white page
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    small = image.convert('RGB')
+    small.thumbnail((64, 64))
+    paletted = small.quantize(colors=8)
+    _count, index = max(paletted.getcolors())
+    red, green, blue = paletted.getpalette()[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def placeholder(image):
+    """Return a tiny preview of an image, shown blurred while it loads, as a ``data:`` URI."""
+    thumbnail = image.copy()
+    thumbnail.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    buffer = io.BytesIO()
+    if features.check('webp'):
+        thumbnail.save(buffer, format='WEBP', quality=40)
+        content_type = 'image/webp'
+    else:
+        thumbnail.save(buffer, format='PNG', optimize=True)
+        content_type = 'image/png'
+    return f'data:{content_type};base64,{base64.b64encode(buffer.getvalue()).decode()}'
+
+
+def render_variants(data, widths, formats):
+    """Decode an image and encode it at each width in each format.
+
+    Widths larger than the image are replaced by its own width, so images
+    are never upscaled. EXIF orientation is applied to the pixels and no
+    metadata (EXIF, XMP, ICC profile, comments) is written to the variants.
+
+    Returns ``{'width', 'height', 'color', 'placeholder', 'variants':
+    [{'format', 'content_type', 'width', 'height', 'content'}]}``.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        width, height = image.size
+
+        variants = []
+        for target in sorted({min(w, width) for w in widths}):
+            if target == width:
+                resized = image
+            else:
+                resized = image.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+            for name in formats:
+                buffer = io.BytesIO()
+                resized.save(buffer, format=name.upper(), **FORMATS[name]['save'])
+                variants.append({
+                    'format': name,
+                    'content_type': FORMATS[name]['content_type'],
+                    'width': resized.width,
+                    'height': resized.height,
+                    'content': buffer.getvalue(),
+                })
+        color = dominant_color(image)
+        preview = placeholder(image)
+    return {'width': width, 'height': height, 'color': color, 'placeholder': preview, 'variants': variants}
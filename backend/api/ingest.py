@@ -0,0 +1,306 @@
+# backend/api/ingest.py
+# Queued ingestion of contact form submissions.
+#
+# With CONTACT_QUEUE_ENABLED, a POST to /api/contacts/ only validates the
+# submission and appends it to a local SQLite journal (CONTACT_QUEUE_PATH),
+# then answers 202 with a ticket. The write is one fsync'd append to a local
+# file, so the request never waits on the primary database.
+#
+# A background thread in each process drains the journal: it claims a batch
+# of entries, stores them with one bulk_create and marks them stored. If
+# the batch fails, it is stored again in halves, so an entry that can't be
+# stored is retried (and eventually failed) without the rest of its batch.
+# Each Contact records the ticket it came from (submission_id), so a batch
+# that is claimed again after a crash is never stored twice. bulk_create
+# sends no signals, so the drain updates the analytics counters and cache
+# revision and queues spam scoring and notifications itself.
+#
+# When CONTACT_QUEUE_MAX_PENDING entries are waiting, enqueue() raises
+# QueueFull and the view answers 503 with Retry-After. Entries outlive the
+# process that queued them: any process's drain thread picks them up at its
+# next poll, and the drain_contacts management command stores them too.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from . import outbox
+from .analytics import record_created
+from .cache import bump_revision
+from .models import Contact
+from .spam import schedule as schedule_spam_scoring
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+CLAIMED = 'claimed'
+STORED = 'stored'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    received_at REAL NOT NULL,
+    claimed_at REAL,
+    stored_at REAL,
+    contact_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS submissions_status_idx ON submissions (status, id);
+"""
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Journal:
+    """The SQLite file submissions wait in until they are stored."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.local = threading.local()
+
+    @property
+    def connection(self):
+        # sqlite3 connections can't be shared between threads
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # WAL: appends don't block the drain's reads; FULL: a 202 survives a power cut
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=FULL')
+            conn.executescript(SCHEMA)
+            self.local.conn, self.local.pid = conn, os.getpid()
+        return conn
+
+    def write(self):
+        """Transaction that takes the write lock up front, so counts and claims don't race."""
+        conn = self.connection
+        conn.execute('BEGIN IMMEDIATE')
+        return conn
+
+    def append(self, payload, max_pending):
+        ticket = str(uuid.uuid4())
+        conn = self.write()
+        try:
+            pending = conn.execute(
+                'SELECT COUNT(*) FROM submissions WHERE status IN (?, ?)', (QUEUED, CLAIMED)
+            ).fetchone()[0]
+            if pending >= max_pending:
+                raise QueueFull
+            conn.execute(
+                'INSERT INTO submissions (ticket, payload, status, received_at) VALUES (?, ?, ?, ?)',
+                (ticket, json.dumps(payload), QUEUED, time.time()),
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return ticket
+
+    def claim(self, limit, claim_timeout):
+        """Claim up to ``limit`` queued entries, and any whose claim has expired, oldest first."""
+        now = time.time()
+        conn = self.write()
+        try:
+            rows = conn.execute(
+                'SELECT id, ticket, payload FROM submissions'
+                ' WHERE status = ? OR (status = ? AND claimed_at < ?) ORDER BY id LIMIT ?',
+                (QUEUED, CLAIMED, now - claim_timeout, limit),
+            ).fetchall()
+            conn.executemany(
+                'UPDATE submissions SET status = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?',
+                [(CLAIMED, now, row['id']) for row in rows],
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return rows
+
+    def mark_stored(self, contact_ids):
+        """Record the Contact each ticket was stored as: ``{ticket: contact id}``."""
+        now = time.time()
+        self.connection.executemany(
+            'UPDATE submissions SET status = ?, stored_at = ?, error = NULL, contact_id = ? WHERE ticket = ?',
+            [(STORED, now, contact_id, ticket) for ticket, contact_id in contact_ids.items()],
+        )
+
+    def release(self, tickets, error, max_attempts):
+        """Return entries whose batch failed to the queue, or fail them after ``max_attempts``."""
+        self.connection.executemany(
+            'UPDATE submissions SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,'
+            ' claimed_at = NULL, error = ? WHERE ticket = ?',
+            [(max_attempts, FAILED, QUEUED, error, ticket) for ticket in tickets],
+        )
+
+    def get(self, ticket):
+        return self.connection.execute(
+            'SELECT ticket, status, received_at, stored_at FROM submissions WHERE ticket = ?', (ticket,)
+        ).fetchone()
+
+    def pending(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM submissions WHERE status IN (?, ?)', (QUEUED, CLAIMED)
+        ).fetchone()[0]
+
+    def purge(self, older_than):
+        """Forget stored entries older than ``older_than`` seconds; failed ones are kept."""
+        self.connection.execute(
+            'DELETE FROM submissions WHERE status = ? AND stored_at < ?', (STORED, time.time() - older_than)
+        )
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+_worker = None
+_worker_pid = None
+_worker_wakeup = threading.Event()
+
+
+def get_journal():
+    global _journal
+    with _journal_lock:
+        if _journal is None or _journal.path != str(settings.CONTACT_QUEUE_PATH):
+            _journal = Journal(settings.CONTACT_QUEUE_PATH)
+        return _journal
+
+
+def enqueue(payload):
+    """Append a validated submission to the journal and return its ticket.
+
+    Raises QueueFull when CONTACT_QUEUE_MAX_PENDING submissions are waiting.
+    """
+    ticket = get_journal().append(payload, settings.CONTACT_QUEUE_MAX_PENDING)
+    ensure_worker()
+    _worker_wakeup.set()
+    return ticket
+
+
+def timestamp(value):
+    return datetime.fromtimestamp(value, dt_timezone.utc) if value is not None else None
+
+
+def submission_status(ticket):
+    """Return ``{ticket, status, received_at, stored_at}`` for a ticket, or None."""
+    ensure_worker()
+    row = get_journal().get(str(ticket))
+    if row is None:
+        return None
+    return {
+        'ticket': row['ticket'],
+        # A claimed entry is still waiting as far as the submitter is concerned
+        'status': QUEUED if row['status'] == CLAIMED else row['status'],
+        'received_at': timestamp(row['received_at']),
+        'stored_at': timestamp(row['stored_at']),
+    }
+
+
+def store_contacts(tickets, rows):
+    """Store journal rows as Contacts in one transaction. Returns ``{ticket: contact id}``."""
+    with transaction.atomic():
+        # Entries stored before a crash, but not yet marked stored, keep their row
+        existing = set(Contact.objects.filter(submission_id__in=tickets).values_list('submission_id', flat=True))
+        contacts = [
+            Contact(submission_id=ticket, **json.loads(row['payload']))
+            for ticket, row in zip(tickets, rows)
+            if ticket not in existing
+        ]
+        Contact.objects.bulk_create(contacts)
+        record_created('contacts', contacts)
+        schedule_spam_scoring(contact.pk for contact in contacts)
+        outbox.contact_received(contacts)
+        contact_ids = dict(Contact.objects.filter(submission_id__in=tickets).values_list('submission_id', 'id'))
+        if contacts:
+            transaction.on_commit(lambda: bump_revision(Contact))
+    return contact_ids
+
+
+def store_rows(journal, tickets, rows):
+    """Store rows, splitting a batch that fails in halves so only failing entries are released.
+
+    Returns the first error, or None if every row was stored.
+    """
+    try:
+        contact_ids = store_contacts(tickets, rows)
+    except Exception as exc:
+        if len(rows) == 1:
+            logger.exception('Could not store queued contact submission %s', rows[0]['ticket'])
+            journal.release([rows[0]['ticket']], str(exc), settings.CONTACT_QUEUE_MAX_ATTEMPTS)
+            return exc
+    else:
+        journal.mark_stored({str(ticket): contact_id for ticket, contact_id in contact_ids.items()})
+        return None
+    middle = len(rows) // 2
+    first = store_rows(journal, tickets[:middle], rows[:middle])
+    second = store_rows(journal, tickets[middle:], rows[middle:])
+    return first or second
+
+
+def drain_batch():
+    """Store one batch of queued submissions. Returns the number of entries claimed."""
+    journal = get_journal()
+    rows = journal.claim(settings.CONTACT_QUEUE_BATCH_SIZE, settings.CONTACT_QUEUE_CLAIM_TIMEOUT)
+    if not rows:
+        return 0
+    error = store_rows(journal, [uuid.UUID(row['ticket']) for row in rows], rows)
+    if error is not None:
+        # Stop draining until the next poll, so a failing entry isn't retried in a tight loop
+        raise error
+    return len(rows)
+
+
+def drain():
+    """Store every queued submission. Returns the number stored."""
+    stored = 0
+    while True:
+        claimed = drain_batch()
+        stored += claimed
+        if claimed < settings.CONTACT_QUEUE_BATCH_SIZE:
+            return stored
+
+
+def run_worker():
+    journal = get_journal()
+    last_purge = 0
+    while True:
+        # Also wake up periodically for entries other processes left behind
+        _worker_wakeup.wait(settings.CONTACT_QUEUE_POLL_INTERVAL)
+        _worker_wakeup.clear()
+        try:
+            drain()
+            if time.monotonic() - last_purge > settings.CONTACT_QUEUE_RETENTION:
+                journal.purge(settings.CONTACT_QUEUE_RETENTION)
+                last_purge = time.monotonic()
+        except Exception:
+            # Logged by drain_batch; try again at the next poll
+            pass
+        finally:
+            connections.close_all()
+
+
+def ensure_worker():
+    """Start this process's drain thread if it isn't running."""
+    global _worker, _worker_pid
+    with _journal_lock:
+        # Threads don't survive a fork (e.g. gunicorn --preload); start a new one
+        if _worker is None or _worker_pid != os.getpid() or not _worker.is_alive():
+            _worker = threading.Thread(target=run_worker, name='contact-queue', daemon=True)
+            _worker.start()
+            _worker_pid = os.getpid()
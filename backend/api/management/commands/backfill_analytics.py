@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from api.analytics import backfill_content_changes, rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the analytics counters and hourly/daily rollups from existing rows'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding row counters and creation rollups...')
+        rebuild_counters()
+        self.stdout.write('Seeding content change rollups...')
+        backfill_content_changes()
+        self.stdout.write(self.style.SUCCESS('Analytics backfill complete.'))
@@ -0,0 +1,49 @@
+import contextlib
+import io
+import time
+
+import firebase_admin
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from teniola_site.firebase_authentication import FirebaseAuthentication, certificate_store, token_cache
+from teniola_site.firebase_certs import CertificateStore, LocalIssuer, install_certificate_store
+
+
+class Command(BaseCommand):
+    help = 'Benchmark Firebase token authentication against a local stand-in issuer (no network)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help='Number of authentications per scenario')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        issuer = LocalIssuer(project_id=firebase_admin.get_app().project_id)
+        token = issuer.mint('benchmark-user', email='benchmark@example.com')
+        request = RequestFactory().get('/api/current-admin-user/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        authentication = FirebaseAuthentication()
+
+        install_certificate_store(CertificateStore(local_certs=issuer.certs))
+        try:
+            cold = self.run_scenario(authentication, request, iterations, clear_cache=True)
+            warm = self.run_scenario(authentication, request, iterations, clear_cache=False)
+        finally:
+            install_certificate_store(certificate_store)
+            token_cache.clear()
+
+        self.stdout.write(f'Signature verification on every request: {cold:.3f} ms/auth')
+        self.stdout.write(f'Verified token cache:                    {warm:.3f} ms/auth')
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {cold / warm:.1f}x over {iterations} iterations'))
+
+    def run_scenario(self, authentication, request, iterations, clear_cache):
+        token_cache.clear()
+        # FirebaseAuthentication logs every call to stdout; keep the report readable.
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                if clear_cache:
+                    token_cache.clear()
+                user, _ = authentication.authenticate(request)
+            elapsed = time.perf_counter() - started
+        assert user.uid == 'benchmark-user'
+        return elapsed / iterations * 1000
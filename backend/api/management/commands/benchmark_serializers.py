@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.models import Project, Testimonial
+from api.serializers import ProjectReadSerializer, ProjectSerializer, TestimonialReadSerializer, TestimonialSerializer
+
+# (model, ModelSerializer, read serializer, factory for one seeded row)
+SCENARIOS = [
+    (Project, ProjectSerializer, ProjectReadSerializer,
+     lambda i: Project(title=f'Project {i}', description='Seeded', image=f'projects/{i}.png', tags=['a', 'b'])),
+    (Testimonial, TestimonialSerializer, TestimonialReadSerializer,
+     lambda i: Testimonial(name=f'Client {i}', feedback='Seeded', position='CTO', image=f'testimonials/{i}.png')),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare the public read serializers with the ModelSerializers they replace (rolled back, no writes kept)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[10, 1000, 10000], help='Row counts to measure')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement; the fastest is reported')
+
+    def handle(self, *args, **options):
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            request = Request(APIRequestFactory().get('/api/projects/'))
+            context = {'request': request}
+            for model, model_serializer, read_serializer, make_row in SCENARIOS:
+                self.stdout.write(f'{model.__name__}:')
+                for rows in options['rows']:
+                    with transaction.atomic():
+                        model.objects.all().delete()
+                        model.objects.bulk_create(make_row(i) for i in range(rows))
+                        before = self.measure(model_serializer, model, context, options['repeat'])
+                        after = self.measure(read_serializer, model, context, options['repeat'])
+                        transaction.set_rollback(True)
+                    self.stdout.write(
+                        f'  {rows:>6} rows  ModelSerializer {before:9.2f} ms  '
+                        f'read serializer {after:8.2f} ms  ' + self.style.SUCCESS(f'{before / after:5.1f}x')
+                    )
+
+    def measure(self, serializer_class, model, context, repeat):
+        """Fastest time in ms to fetch and serialize every row, as a list view does."""
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serializer_class(model.objects.order_by('-created_at'), many=True, context=context).data
+            best = min(best, time.perf_counter() - started)
+        return best * 1000
@@ -0,0 +1,62 @@
+import posixpath
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from api.models import ImageVariantsField
+
+
+class Command(BaseCommand):
+    help = 'Delete media files that no FileField/ImageField (or image variant) references any more'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='List the files that would be deleted')
+        parser.add_argument('--min-age', type=int, default=24,
+                            help='Keep files modified in the last N hours (uploads still in flight)')
+
+    def handle(self, *args, **options):
+        referenced = self.referenced_names()
+        cutoff = timezone.now() - timedelta(hours=options['min_age'])
+        deleted = freed = 0
+        for name in self.stored_names(default_storage):
+            if name in referenced or default_storage.get_modified_time(name) > cutoff:
+                continue
+            size = default_storage.size(name)
+            if options['dry_run']:
+                self.stdout.write(f'Would delete {name} ({size} bytes)')
+            else:
+                default_storage.delete(name)
+                self.stdout.write(f'Deleted {name}')
+            deleted += 1
+            freed += size
+        if deleted:
+            verb = 'Would free' if options['dry_run'] else 'Freed'
+            self.stdout.write(self.style.SUCCESS(f'{verb} {freed} bytes in {deleted} unreferenced file(s).'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Nothing to collect.'))
+
+    @staticmethod
+    def referenced_names():
+        """Every file name stored in a file field or image variants column."""
+        referenced = set()
+        for model in apps.get_models():
+            file_fields = [f.name for f in model._meta.concrete_fields if isinstance(f, models.FileField)]
+            variant_fields = [f.name for f in model._meta.concrete_fields if isinstance(f, ImageVariantsField)]
+            if not file_fields and not variant_fields:
+                continue
+            for row in model._default_manager.values_list(*file_fields, *variant_fields).iterator():
+                referenced.update(name for name in row[:len(file_fields)] if name)
+                for meta in row[len(file_fields):]:
+                    referenced.update(source['name'] for source in (meta or {}).get('sources', ()))
+        return referenced
+
+    def stored_names(self, storage, directory=''):
+        directories, files = storage.listdir(directory)
+        for name in files:
+            yield posixpath.join(directory, name)
+        for name in directories:
+            yield from self.stored_names(storage, posixpath.join(directory, name))
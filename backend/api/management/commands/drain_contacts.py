@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.ingest import drain, get_journal
+
+
+class Command(BaseCommand):
+    help = 'Store the contact form submissions waiting in the queue journal'
+
+    def handle(self, *args, **options):
+        journal = get_journal()
+        pending = journal.pending()
+        if not pending:
+            self.stdout.write('No queued submissions.')
+            return
+        self.stdout.write(f'Storing {pending} queued submission(s)...')
+        try:
+            stored = drain()
+        except Exception as exc:
+            raise CommandError(f'Could not store queued submissions: {exc}')
+        journal.purge(settings.CONTACT_QUEUE_RETENTION)
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} submission(s).'))
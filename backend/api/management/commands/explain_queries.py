@@ -0,0 +1,223 @@
+import json
+import re
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.analytics import rebuild_counters
+from api.cache import bump_revision
+from api.models import (
+    AdminInvitation,
+    AdminRole,
+    AdminUser,
+    Contact,
+    Education,
+    Experience,
+    Project,
+    Service,
+    Skill,
+    SocialLink,
+    Testimonial,
+)
+from api.signals import CACHED_MODELS
+from teniola_site.firebase_authentication import FirebaseUser
+
+SUPERADMIN_UID = 'explain-superadmin'
+ADMIN_UID = 'explain-admin'
+INVITE_CODE = 'EXPLAIN0'
+SEED_PERMISSIONS = [
+    'manage_projects', 'manage_skills', 'manage_about', 'manage_experience', 'manage_education',
+    'manage_testimonials', 'manage_services', 'manage_settings', 'view_analytics',
+]
+
+# (path, Firebase UID to authenticate as)
+ENDPOINTS = [
+    ('/api/projects/', None),
+    ('/api/skills/', None),
+    ('/api/experiences/', None),
+    ('/api/educations/', None),
+    ('/api/about/', None),
+    ('/api/testimonials/', None),
+    ('/api/sociallinks/', None),
+    ('/api/settings/', None),
+    ('/api/services/', None),
+    ('/api/portfolio/', None),
+    (f'/api/validate-invitation/?code={INVITE_CODE}', None),
+    ('/api/admin/projects/', SUPERADMIN_UID),
+    ('/api/admin/skills/', SUPERADMIN_UID),
+    ('/api/admin/experiences/', SUPERADMIN_UID),
+    ('/api/admin/educations/', SUPERADMIN_UID),
+    ('/api/admin/contacts/', SUPERADMIN_UID),
+    ('/api/admin/contacts/?spam=false', SUPERADMIN_UID),
+    ('/api/admin/contacts/?min_spam_score=0.9', SUPERADMIN_UID),
+    ('/api/admin/testimonials/', SUPERADMIN_UID),
+    ('/api/admin/sociallinks/', SUPERADMIN_UID),
+    ('/api/admin/settings/', SUPERADMIN_UID),
+    ('/api/admin/services/', SUPERADMIN_UID),
+    ('/api/admin-users/', SUPERADMIN_UID),
+    ('/api/admin-invitations/', SUPERADMIN_UID),
+    ('/api/admin-invitations/?status=pending', SUPERADMIN_UID),
+    ('/api/admin-invitations/', ADMIN_UID),
+    ('/api/admin-invitations/?status=pending', ADMIN_UID),
+    ('/api/current-admin-user/', ADMIN_UID),
+    ('/api/analytics/', SUPERADMIN_UID),
+    ('/api/analytics/timeseries/?metric=contacts&granularity=hour', SUPERADMIN_UID),
+]
+
+# Tables seeded with --rows rows; a full scan of any of them is reported.
+LARGE_MODELS = [
+    Project, Skill, Experience, Education, Contact, Testimonial, SocialLink, Service, AdminUser, AdminInvitation,
+]
+
+# "SCAN api_project" (or "SCAN TABLE api_project" before SQLite 3.36) with no "USING ... INDEX"
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a large dataset, call every API endpoint and EXPLAIN the queries it runs; '
+        'fails if any query scans a seeded table sequentially. All changes are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Rows to seed in each large table')
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            raise CommandError(f'Unsupported database backend: {connection.vendor}')
+        self.large_tables = {model._meta.db_table for model in LARGE_MODELS}
+        self.verbosity = options['verbosity']
+
+        # Keep the run away from the real cache
+        with override_settings(
+            ALLOWED_HOSTS=['testserver'],
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                'LOCATION': 'explain-queries'}},
+        ), transaction.atomic():
+            self.seed(options['rows'])
+            violations = self.check_endpoints()
+            transaction.set_rollback(True)
+
+        if violations:
+            for path, sql, detail in violations:
+                self.stderr.write(f'{path}: {detail}\n    {sql}')
+            raise CommandError(f'{len(violations)} queries scan a large table sequentially')
+        self.stdout.write(self.style.SUCCESS(f'No sequential scans over {len(self.large_tables)} seeded tables'))
+
+    def seed(self, rows):
+        self.stdout.write(f'Seeding {rows} rows per table on {connection.vendor}...')
+        permissions = {'permissions': SEED_PERMISSIONS}
+        superadmin_role, _ = AdminRole.objects.update_or_create(
+            name='superadmin', defaults={'description': 'Super Admin', 'permissions': permissions})
+        admin_role, _ = AdminRole.objects.update_or_create(
+            name='admin', defaults={'description': 'Admin', 'permissions': permissions})
+        superadmin = AdminUser.objects.create(
+            firebase_uid=SUPERADMIN_UID, email='explain-superadmin@example.com', role=superadmin_role)
+        admin = AdminUser.objects.create(firebase_uid=ADMIN_UID, email='explain-admin@example.com', role=admin_role)
+
+        today = date.today()
+        AdminUser.objects.bulk_create(
+            AdminUser(firebase_uid=f'explain-{i}', email=f'explain-{i}@example.com', role=admin_role)
+            for i in range(rows)
+        )
+        statuses = [choice for choice, _ in AdminInvitation.STATUS_CHOICES]
+        expires_at = timezone.now() + timedelta(days=7)
+        AdminInvitation.objects.bulk_create(
+            AdminInvitation(
+                invite_code=INVITE_CODE if i == 0 else f'X{i:07d}',
+                email=f'invitee-{i}@example.com',
+                role=admin_role,
+                invited_by=admin if i % 10 == 0 else superadmin,
+                status=statuses[i % len(statuses)],
+                expires_at=expires_at,
+            )
+            for i in range(rows)
+        )
+        Project.objects.bulk_create(
+            Project(title=f'Project {i}', description='Seeded', image='projects/seed.png') for i in range(rows))
+        Skill.objects.bulk_create(Skill(name=f'Skill {i}', proficiency=i % 100) for i in range(rows))
+        Experience.objects.bulk_create(
+            Experience(job_title='Engineer', company=f'Company {i}', start_date=today, description='Seeded')
+            for i in range(rows)
+        )
+        Education.objects.bulk_create(
+            Education(degree='BSc', institution=f'School {i}', start_date=today) for i in range(rows))
+        Contact.objects.bulk_create(
+            Contact(name=f'Sender {i}', email=f'sender-{i}@example.com', message='Seeded', spam_score=(i % 10) / 10)
+            for i in range(rows)
+        )
+        Testimonial.objects.bulk_create(
+            Testimonial(name=f'Client {i}', feedback='Seeded', position='CTO') for i in range(rows))
+        SocialLink.objects.bulk_create(
+            SocialLink(platform=f'Platform {i}', icon='link', url='https://example.com') for i in range(rows))
+        Service.objects.bulk_create(Service(name=f'Service {i}', description='Seeded') for i in range(rows))
+        rebuild_counters()
+
+        # Give the planner statistics for the new rows
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                for table in sorted(self.large_tables):
+                    cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+            else:
+                cursor.execute('ANALYZE')
+
+    def check_endpoints(self):
+        client = APIClient()
+        violations = []
+        for path, uid in ENDPOINTS:
+            # Measure the first request after an edit: every cached response
+            # and admin lookup misses, but validators are warm.
+            for model in CACHED_MODELS:
+                bump_revision(model)
+            client.force_authenticate(FirebaseUser(uid) if uid else None)
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(path)
+            if response.status_code != 200:
+                raise CommandError(f'{path} returned HTTP {response.status_code}')
+
+            selects = [query['sql'] for query in queries if query['sql'].lstrip().upper().startswith('SELECT')]
+            self.stdout.write(f'{path} ({len(selects)} queries)')
+            for sql in selects:
+                plan, scanned = self.explain(sql)
+                if self.verbosity >= 2:
+                    self.stdout.write(f'  {sql}\n' + '\n'.join(f'    {line}' for line in plan))
+                violations.extend((path, sql, f'sequential scan of {table}') for table in scanned)
+        return violations
+
+    def explain(self, sql):
+        """Return (plan lines, large tables scanned sequentially) for a query."""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                details = [row[-1] for row in cursor.fetchall()]
+                scanned = []
+                for detail in details:
+                    match = SQLITE_FULL_SCAN.match(detail)
+                    if match and match.group(1) in self.large_tables:
+                        scanned.append(match.group(1))
+                return details, scanned
+
+            # A sequential scan PostgreSQL still picks with seq scans disabled has no usable index.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+            plan = cursor.fetchone()[0]
+            cursor.execute('SET LOCAL enable_seqscan = on')
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        lines, scanned = [], []
+        self._walk_plan(plan[0]['Plan'], 0, lines, scanned)
+        return lines, scanned
+
+    def _walk_plan(self, node, depth, lines, scanned):
+        relation = node.get('Relation Name')
+        index = node.get('Index Name')
+        lines.append('  ' * depth + node['Node Type'] + (f' on {relation}' if relation else '')
+                     + (f' using {index}' if index else ''))
+        if node['Node Type'] == 'Seq Scan' and relation in self.large_tables:
+            scanned.append(relation)
+        for child in node.get('Plans', []):
+            self._walk_plan(child, depth + 1, lines, scanned)
@@ -0,0 +1,112 @@
+import json
+import random
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept Django's messages and print them."""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        self.reply('220 notification-sink ready')
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors='replace').strip()
+            verb = command[:4].upper()
+            if verb in ('HELO', 'EHLO'):
+                self.reply('250 notification-sink')
+            elif verb == 'MAIL':
+                sender, recipients = command[10:], []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command[8:])
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                for data in iter(self.rfile.readline, b''):
+                    if data in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(data.decode(errors='replace').rstrip('\r\n'))
+                if self.server.fail_rate and random.random() < self.server.fail_rate:
+                    self.reply('451 Simulated temporary failure')
+                else:
+                    self.server.log(f'EMAIL from {sender} to {", ".join(recipients)}\n' + '\n'.join(lines))
+                    self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                # RSET, NOOP and anything else
+                self.reply('250 OK')
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.server.fail_rate and random.random() < self.server.fail_rate:
+            self.send_response(503)
+            self.end_headers()
+            return
+        try:
+            events = json.loads(body).get('events', [])
+        except ValueError:
+            events = []
+        signature = self.headers.get('X-Webhook-Signature', 'unsigned')
+        self.server.log(f'WEBHOOK {self.path} ({len(events)} events, {signature})\n' + json.dumps(events, indent=2))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Run a local SMTP server and webhook receiver that print the notifications they get. '
+        'Point EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend, EMAIL_PORT and '
+        'NOTIFICATION_WEBHOOK_URL at it to test notifications without sending anything.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--smtp-port', type=int, default=1025)
+        parser.add_argument('--http-port', type=int, default=8025)
+        parser.add_argument('--fail-rate', type=float, default=0.0,
+                            help='Fraction of deliveries to reject with a temporary error, to exercise retries')
+
+    def handle(self, *args, **options):
+        lock = threading.Lock()
+
+        def log(text):
+            with lock:
+                self.stdout.write(text)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        smtp = socketserver.ThreadingTCPServer(('127.0.0.1', options['smtp_port']), SMTPHandler)
+        http = ThreadingHTTPServer(('127.0.0.1', options['http_port']), WebhookHandler)
+        for server in (smtp, http):
+            server.daemon_threads = True
+            server.fail_rate = options['fail_rate']
+            server.log = log
+        threading.Thread(target=smtp.serve_forever, daemon=True).start()
+        self.stdout.write(
+            f'SMTP on 127.0.0.1:{options["smtp_port"]}, webhooks on '
+            f'http://127.0.0.1:{options["http_port"]}/ (Ctrl+C to stop)'
+        )
+        try:
+            http.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            smtp.shutdown()
+            smtp.server_close()
+            http.server_close()
@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from api.images import FAILED, IMAGE_FIELDS, READY, process_image, variants_field_name
+
+
+class Command(BaseCommand):
+    help = 'Generate responsive variants, dimensions, colors and placeholders for images missing them'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Regenerate the variants of every image, including ones that failed')
+        parser.add_argument('--workers', type=int, default=settings.IMAGE_PROCESSING_WORKERS,
+                            help='Images processed in parallel')
+
+    def handle(self, *args, **options):
+        jobs = []
+        for model, fields in IMAGE_FIELDS.items():
+            for field_name in fields:
+                rows = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                for pk, name, meta in rows.values_list('pk', field_name, variants_field_name(field_name)):
+                    meta = meta or {}
+                    status = meta.get('status')
+                    # Variants made before placeholders were added count as missing
+                    if (options['all'] or meta.get('source') != name or status not in (READY, FAILED)
+                            or (status == READY and 'placeholder' not in meta)):
+                        jobs.append((model, pk, field_name))
+
+        if not jobs:
+            self.stdout.write('All images are up to date.')
+            return
+        self.stdout.write(f'Processing {len(jobs)} image(s)...')
+        workers = max(1, options['workers'])
+        with ProcessPoolExecutor(max_workers=workers) as pool, ThreadPoolExecutor(max_workers=workers) as threads:
+            for future in [threads.submit(self.process, pool, *job) for job in jobs]:
+                future.result()
+        self.stdout.write(self.style.SUCCESS('Image processing complete.'))
+
+    @staticmethod
+    def process(pool, model, pk, field_name):
+        try:
+            process_image(model, pk, field_name, pool=pool)
+        finally:
+            connections.close_all()
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from api.models import Contact
+from api.spam import score_contacts
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Score contact messages for spam and index their near-duplicate fingerprints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Rescore every message, not only unscored ones')
+
+    def handle(self, *args, **options):
+        contacts = Contact.objects.all() if options['all'] else Contact.objects.filter(spam_score__isnull=True)
+        ids = list(contacts.order_by('id').values_list('id', flat=True))
+        if not ids:
+            self.stdout.write('All contact messages are scored.')
+            return
+        self.stdout.write(f'Scoring {len(ids)} message(s)...')
+        # Oldest first, so each message is compared with the ones before it
+        for start in range(0, len(ids), BATCH_SIZE):
+            score_contacts(ids[start:start + BATCH_SIZE])
+        self.stdout.write(self.style.SUCCESS('Scoring complete.'))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from api.models import OutboxMessage
+from api.outbox import purge, send_due
+
+
+class Command(BaseCommand):
+    help = 'Send the notifications that are due in the outbox'
+
+    def handle(self, *args, **options):
+        attempted = send_due()
+        purge()
+        failed = OutboxMessage.objects.filter(status=OutboxMessage.FAILED).count()
+        pending = OutboxMessage.objects.filter(status=OutboxMessage.PENDING).count()
+        self.stdout.write(f'Attempted {attempted} message(s); {pending} pending, {failed} failed.')
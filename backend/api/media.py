@@ -0,0 +1,146 @@
+# backend/api/media.py
+# Serving MEDIA_URL.
+#
+# Behind nginx (MEDIA_ACCEL_REDIRECT_PREFIX set), the view only checks the
+# request and answers with an X-Accel-Redirect to an internal location, so
+# nginx sends the file itself (with its own Range and conditional request
+# handling) and no app worker is held for the transfer. Otherwise the file
+# is served from Python: conditional requests are answered with 304, a
+# single byte range with 206, and whole files and open-ended ranges go
+# through FileResponse, which the WSGI server can send with sendfile().
+
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .storage import is_hashed_name
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+# Bytes read at a time for a bounded range
+BLOCK_SIZE = 64 * 1024
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+MUTABLE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """Return the inclusive ``(start, end)`` of a single byte range, or None to send the whole file.
+
+    Multiple ranges and malformed headers are ignored, as RFC 9110 allows.
+    Raises RangeNotSatisfiable when the range starts past the end.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable
+    if end < start:
+        return None
+    return start, end
+
+
+def read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            block = file.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+def authorize(request, name):
+    """Reject names outside the media files, such as hidden files and parent directories."""
+    parts = name.split('/')
+    if not name or any(part in ('', '.', '..') or part.startswith('.') for part in parts):
+        raise Http404
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(path):
+        raise Http404
+    return path
+
+
+def serve_media(request, path):
+    name = posixpath.normpath(path) if path else ''
+    full_path = authorize(request, name)
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    immutable = is_hashed_name(name)
+    cache_control = IMMUTABLE_CACHE_CONTROL if immutable else MUTABLE_CACHE_CONTROL
+
+    accel_prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX
+    if accel_prefix:
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(name)
+        response['Cache-Control'] = cache_control
+        return response
+
+    stat = os.stat(full_path)
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    if immutable:
+        etag = f'"{posixpath.splitext(posixpath.basename(name))[0]}"'
+    else:
+        etag = '"%s"' % hashlib.md5(f'{name}:{stat.st_mtime_ns}:{size}'.encode()).hexdigest()
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = file_response(request, full_path, size, content_type, etag, last_modified)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = cache_control
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def file_response(request, path, size, content_type, etag, last_modified):
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    # A Range is only honored while the client's copy is still current
+    if request.method in ('GET', 'HEAD') and if_range in (None, etag, http_date(last_modified)):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    if byte_range is None or byte_range == (0, size - 1):
+        return FileResponse(open(path, 'rb'), content_type=content_type)
+
+    start, end = byte_range
+    if end == size - 1:
+        # Open-ended ranges (resuming a download) can still use sendfile()
+        file = open(path, 'rb')
+        file.seek(start)
+        response = FileResponse(file, content_type=content_type, status=206)
+    else:
+        response = StreamingHttpResponse(read_range(path, start, end - start + 1), content_type=content_type, status=206)
+        response['Content-Length'] = str(end - start + 1)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
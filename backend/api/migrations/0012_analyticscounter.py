@@ -0,0 +1,64 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:05
+
+from datetime import datetime, timezone
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDay
+
+
+TRACKED_MODELS = {
+    'projects': 'Project',
+    'skills': 'Skill',
+    'experiences': 'Experience',
+    'contacts': 'Contact',
+    'testimonials': 'Testimonial',
+}
+
+
+def build_counters(apps, schema_editor):
+    """Seed the counters from the rows that already exist."""
+    AnalyticsCounter = apps.get_model('api', 'AnalyticsCounter')
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    counters = []
+    for metric, model_name in TRACKED_MODELS.items():
+        model = apps.get_model('api', model_name)
+        counters.append(AnalyticsCounter(metric=metric, granularity='total', bucket=epoch, value=model.objects.count()))
+        days = (
+            model.objects.order_by()
+            .annotate(day=TruncDay('created_at', tzinfo=timezone.utc))
+            .values('day')
+            .annotate(count=Count('id'))
+        )
+        counters.extend(
+            AnalyticsCounter(metric=metric, granularity='day', bucket=row['day'], value=row['count'])
+            for row in days
+        )
+    AnalyticsCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_about_updated_at_contact_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=50)),
+                ('granularity', models.CharField(choices=[('total', 'Total'), ('day', 'Day')], max_length=10)),
+                ('bucket', models.DateTimeField()),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Analytics Counter',
+                'verbose_name_plural': 'Analytics Counters',
+                'constraints': [models.UniqueConstraint(fields=('metric', 'granularity', 'bucket'), name='unique_analytics_counter')],
+            },
+        ),
+        migrations.RunPython(build_counters, migrations.RunPython.noop),
+    ]
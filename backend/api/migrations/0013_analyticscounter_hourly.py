@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_analyticscounter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='analyticscounter',
+            name='granularity',
+            field=models.CharField(choices=[('total', 'Total'), ('day', 'Day'), ('hour', 'Hour')], max_length=10),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_analyticscounter_hourly'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='setting',
+            options={'ordering': ('-created_at', '-id'), 'verbose_name': 'Setting', 'verbose_name_plural': 'Settings'},
+        ),
+        migrations.AddIndex(
+            model_name='admininvitation',
+            index=models.Index(fields=['-created_at', '-id'], name='invitation_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='admininvitation',
+            index=models.Index(fields=['invited_by', '-created_at', '-id'], name='invitation_sender_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='admininvitation',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at', '-id'], name='invitation_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminuser',
+            index=models.Index(fields=['-created_at', '-id'], name='adminuser_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-created_at', '-id'], name='education_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-created_at', '-id'], name='experience_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at', '-id'], name='project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['-created_at', '-id'], name='service_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='setting',
+            index=models.Index(fields=['-created_at', '-id'], name='setting_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-created_at', '-id'], name='skill_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sociallink',
+            index=models.Index(fields=['-created_at', '-id'], name='sociallink_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['-created_at', '-id'], name='testimonial_created_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:20
+
+import api.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='about',
+            name='profile_picture_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='company_logo_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='setting',
+            name='site_favicon_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='setting',
+            name='site_logo_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='image_variants',
+            field=api.models.ImageVariantsField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:25
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('target', models.CharField(max_length=100)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('field_name', models.CharField(max_length=50)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('checksum', models.CharField(blank=True, max_length=64)),
+                ('offset', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Chunked Upload',
+                'verbose_name_plural': 'Chunked Uploads',
+                'indexes': [models.Index(fields=['updated_at'], name='chunkedupload_updated_idx')],
+            },
+        ),
+    ]
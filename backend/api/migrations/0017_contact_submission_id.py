@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_chunked_uploads'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='submission_id',
+            field=models.UUIDField(blank=True, editable=False, null=True, unique=True),
+        ),
+    ]
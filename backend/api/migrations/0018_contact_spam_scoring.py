@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_contact_submission_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContactFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.BigIntegerField()),
+            ],
+            options={
+                'verbose_name': 'Contact Fingerprint',
+                'verbose_name_plural': 'Contact Fingerprints',
+            },
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='api.contact'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='spam_reasons',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='spam_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['spam_score', '-created_at', '-id'], name='contact_spam_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['email', '-created_at'], name='contact_email_idx'),
+        ),
+        migrations.AddField(
+            model_name='contactfingerprint',
+            name='contact',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fingerprints', to='api.contact'),
+        ),
+        migrations.AddIndex(
+            model_name='contactfingerprint',
+            index=models.Index(fields=['bucket'], name='fingerprint_bucket_idx'),
+        ),
+    ]
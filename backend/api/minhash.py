@@ -0,0 +1,69 @@
+# backend/api/minhash.py
+# MinHash signatures and LSH banding for near-duplicate text (see api/spam.py).
+#
+# A message is reduced to the set of its word 3-grams ("shingles"). The
+# MinHash signature keeps, for each of SIGNATURE_SIZE hash functions, the
+# smallest hash of any shingle; two messages agree on a signature position
+# with probability equal to the Jaccard similarity of their shingle sets.
+# The signature is cut into BANDS bands of ROWS positions and each band is
+# hashed to a bucket: messages that share any bucket are likely to be at
+# least ~(1 / BANDS) ** (1 / ROWS) = 50% similar, and are then compared
+# exactly. Finding candidates is one lookup per band, however many
+# messages are indexed.
+
+import hashlib
+import random
+import re
+
+SHINGLE_SIZE = 3
+BANDS = 16
+ROWS = 4
+SIGNATURE_SIZE = BANDS * ROWS
+
+MERSENNE_PRIME = (1 << 61) - 1
+# (a, b) of the hash functions h(x) = (a * x + b) mod p; seeded, so stored buckets stay valid
+_rng = random.Random(20240601)
+HASH_PARAMETERS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(SIGNATURE_SIZE)
+]
+
+WORD_RE = re.compile(r'\w+')
+
+
+def hash32(value):
+    # 32-bit shingle hashes keep the products below small and fast
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=4).digest(), 'big')
+
+
+def shingles(text):
+    """The hashed word 3-grams of a text, ignoring case and punctuation."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {hash32(' '.join(words))} if words else set()
+    return {hash32(' '.join(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def signature(shingle_hashes):
+    """MinHash signature of a set of shingles."""
+    if not shingle_hashes:
+        return []
+    return [
+        min([(a * value + b) % MERSENNE_PRIME for value in shingle_hashes])
+        for a, b in HASH_PARAMETERS
+    ]
+
+
+def buckets(minhashes):
+    """LSH bucket of each band of a signature, as signed 64-bit integers."""
+    result = []
+    for band in range(len(minhashes) // ROWS):
+        values = minhashes[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(f'{band}:{values}'.encode(), digest_size=8).digest()
+        result.append(int.from_bytes(digest, 'big', signed=True))
+    return result
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -1,18 +1,40 @@
+import uuid
+
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
 # Create your models here.
 
+class ImageVariantsField(models.JSONField):
+    """Responsive variants of an image field, filled in by api/images.py.
+
+    Holds ``{"source", "status", "width", "height", "sources": [...]}``,
+    or ``{}`` while the image field is empty.
+    """
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('default', dict)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+
 class Project(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField()
     image = models.ImageField(upload_to='projects/')
+    image_variants = ImageVariantsField()
     url = models.URLField(max_length=200, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     tags = models.JSONField(default=list)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='project_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -20,6 +42,12 @@ class Skill(models.Model):
     name = models.CharField(max_length=50)
     proficiency = models.IntegerField(default=0)  # 0-100 scale
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='skill_created_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -30,11 +58,13 @@ class About(models.Model):
     last_name = models.CharField(max_length=200)
     title = models.CharField(max_length=200)
     profile_picture = models.ImageField(upload_to='about/', blank=True, null=True)
+    profile_picture_variants = ImageVariantsField()
     summary = models.TextField()
     email = models.EmailField(blank=True, null=True)
     phone_number = models.CharField(max_length=20, blank=True, null=True)
     address = models.CharField(max_length=255, blank=True, null=True)
     resume = models.FileField(upload_to='about/', blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "About"
@@ -59,10 +89,17 @@ class Experience(models.Model):
     job_title = models.CharField(max_length=100)
     company = models.CharField(max_length=100)
     company_logo = models.ImageField(upload_to='experience/', blank=True, null=True)
+    company_logo_variants = ImageVariantsField()
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='experience_created_idx'),
+        ]
 
 
     def __str__(self):
@@ -74,9 +111,15 @@ class Education(models.Model):
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     url = models.URLField(max_length=200, blank=True, null=True)
     certificate = models.FileField(upload_to='education/', blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='education_created_idx'),
+        ]
+
     def __str__(self):
         return f"{self.degree} from {self.institution}"
 
@@ -85,11 +128,47 @@ class Contact(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
     message = models.TextField()
+    # Ticket of the queued submission this row was stored from (see api/ingest.py)
+    submission_id = models.UUIDField(null=True, blank=True, unique=True, editable=False)
+    # Set in the background by api/spam.py: 0 (fine) to 1 (spam), None until scored
+    spam_score = models.FloatField(null=True, blank=True, editable=False)
+    spam_reasons = models.JSONField(default=list, blank=True, editable=False)
+    duplicate_of = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='+',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+            models.Index(fields=['spam_score', '-created_at', '-id'], name='contact_spam_idx'),
+            models.Index(fields=['email', '-created_at'], name='contact_email_idx'),
+        ]
 
     def __str__(self):
         return f"Message from {self.name} ({self.email})"
 
+class ContactFingerprint(models.Model):
+    """
+    One locality-sensitive hash bucket of a contact message's MinHash
+    signature. Messages sharing a bucket are near-duplicate candidates,
+    found with one indexed lookup instead of comparing every pair. See
+    api/spam.py.
+    """
+    contact = models.ForeignKey(Contact, on_delete=models.CASCADE, related_name='fingerprints')
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        verbose_name = "Contact Fingerprint"
+        verbose_name_plural = "Contact Fingerprints"
+        indexes = [
+            models.Index(fields=['bucket'], name='fingerprint_bucket_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket} -> Contact #{self.contact_id}"
+
 class Testimonial(models.Model):
     name = models.CharField(max_length=100)
     feedback = models.TextField()
@@ -97,7 +176,14 @@ class Testimonial(models.Model):
     position = models.CharField(max_length=100)
     rating = models.IntegerField(default=0)
     image = models.ImageField(upload_to='testimonials/', blank=True, null=True)
+    image_variants = ImageVariantsField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='testimonial_created_idx'),
+        ]
 
     def __str__(self):
         return f"Testimonial from {self.name}"
@@ -108,6 +194,12 @@ class SocialLink(models.Model):
     icon = models.CharField(max_length=50)
     url = models.URLField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='sociallink_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.platform} - {self.url}"
@@ -116,6 +208,8 @@ class Setting(models.Model):
     site_name = models.CharField(max_length=100)
     site_logo = models.ImageField(upload_to='settings/', blank=True, null=True)
     site_favicon = models.ImageField(upload_to='settings/', blank=True, null=True)
+    site_logo_variants = ImageVariantsField()
+    site_favicon_variants = ImageVariantsField()
     site_description = models.TextField()
     site_keywords = models.TextField()
     site_author = models.CharField(max_length=100)
@@ -143,7 +237,10 @@ class Setting(models.Model):
     class Meta:
         verbose_name_plural = "Settings"
         verbose_name = "Setting"
-        ordering = ('site_name', 'site_logo', 'site_favicon', 'site_description', 'site_keywords', 'site_author', 'site_email', 'site_phone', 'site_address', 'site_city', 'site_state', 'site_zip', 'site_country', 'site_copyright', 'site_github', 'site_linkedin', 'site_twitter', 'site_instagram', 'site_facebook', 'site_youtube', 'site_tiktok', 'site_pinterest', 'site_reddit')  
+        ordering = ('-created_at', '-id')
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='setting_created_idx'),
+        ]
 
     def __str__(self):
         return self.site_name
@@ -154,10 +251,19 @@ class Service(models.Model):
     icon = models.CharField(max_length=50, blank=True, null=True)  # FontAwesome or similar icon class
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='service_created_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
 # --- Admin Management Models ---
+# Compiled permission sets per role id, as (role.updated_at, frozenset).
+_compiled_permissions = {}
+
 class AdminRole(models.Model):
     ROLE_CHOICES = [
         ('superadmin', 'Super Admin'),
@@ -181,6 +287,16 @@ class AdminRole(models.Model):
     def __str__(self):
         return self.get_name_display()
 
+    def get_permission_set(self):
+        """Return the role's permissions as a frozenset, compiled once per saved revision of the role."""
+        compiled = _compiled_permissions.get(self.pk)
+        if compiled is None or compiled[0] != self.updated_at:
+            permissions = self.permissions.get('permissions', []) if isinstance(self.permissions, dict) else []
+            compiled = (self.updated_at, frozenset(permissions))
+            if self.pk is not None:
+                _compiled_permissions[self.pk] = compiled
+        return compiled[1]
+
 class AdminInvitation(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -204,6 +320,16 @@ class AdminInvitation(models.Model):
     class Meta:
         verbose_name = "Admin Invitation"
         verbose_name_plural = "Admin Invitations"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='invitation_created_idx'),
+            models.Index(fields=['invited_by', '-created_at', '-id'], name='invitation_sender_idx'),
+            # Only pending invitations are ever looked up by status
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='invitation_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
     
     def __str__(self):
         return f"Invitation for {self.email} ({self.get_status_display()})"
@@ -238,6 +364,9 @@ class AdminUser(models.Model):
     class Meta:
         verbose_name = "Admin User"
         verbose_name_plural = "Admin Users"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='adminuser_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.display_name or self.email} ({self.role.name})"
@@ -246,5 +375,109 @@ class AdminUser(models.Model):
         return self.role.name == 'superadmin'
     
     def has_permission(self, permission):
-        return permission in self.role.permissions.get('permissions', [])
+        return permission in self.role.get_permission_set()
     
+
+
+# --- Analytics Models ---
+class AnalyticsCounter(models.Model):
+    """
+    A maintained count per metric, either overall ('total') or within one
+    day/hour bucket. Row metrics (e.g. 'contacts') count the rows created in
+    a bucket; '*_changes' metrics count saves and deletes of site content.
+    Updated incrementally from model signals, see api/analytics.py.
+    """
+    GRANULARITY_CHOICES = [
+        ('total', 'Total'),
+        ('day', 'Day'),
+        ('hour', 'Hour'),
+    ]
+
+    metric = models.CharField(max_length=50)
+    granularity = models.CharField(max_length=10, choices=GRANULARITY_CHOICES)
+    bucket = models.DateTimeField()  # Start of the bucket; the UNIX epoch for totals
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Analytics Counter"
+        verbose_name_plural = "Analytics Counters"
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'granularity', 'bucket'], name='unique_analytics_counter'),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} ({self.granularity} {self.bucket:%Y-%m-%d %H:%M}): {self.value}"
+
+
+# --- Upload Models ---
+class ChunkedUpload(models.Model):
+    """
+    A resumable upload to a file field of one row. Chunks are appended to a
+    temporary file at ``offset``; on commit the assembled file is attached
+    to the field and the upload is deleted. See api/uploads.py.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    target = models.CharField(max_length=100)  # Model label, e.g. 'api.about'
+    object_id = models.PositiveBigIntegerField()
+    field_name = models.CharField(max_length=50)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64, blank=True)  # Hex SHA-256 of the whole file, if given
+    offset = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Chunked Upload"
+        verbose_name_plural = "Chunked Uploads"
+        indexes = [
+            models.Index(fields=['updated_at'], name='chunkedupload_updated_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} -> {self.target}#{self.object_id}.{self.field_name} ({self.offset}/{self.size})"
+
+
+# --- Notification Models ---
+class OutboxMessage(models.Model):
+    """
+    A notification (email or webhook event) written in the same transaction
+    as the change it reports, so it is sent if and only if the change
+    commits. A background worker sends due messages in batches and retries
+    failures with backoff. See api/outbox.py.
+    """
+    EMAIL = 'email'
+    WEBHOOK = 'webhook'
+    CHANNEL_CHOICES = [
+        (EMAIL, 'Email'),
+        (WEBHOOK, 'Webhook'),
+    ]
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (SENT, 'Sent'),
+        (FAILED, 'Failed'),
+    ]
+
+    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES)
+    event = models.CharField(max_length=50)  # e.g. 'contact.created'
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)  # Not sent or retried before this
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Outbox Message"
+        verbose_name_plural = "Outbox Messages"
+        indexes = [
+            models.Index(fields=['status', 'available_at', 'id'], name='outbox_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.event} via {self.channel} ({self.status})"
@@ -0,0 +1,248 @@
+# backend/api/outbox.py
+# Transactional outbox for notifications.
+#
+# Views never send email or call webhooks themselves. They write
+# OutboxMessage rows in the same transaction as the row they report on
+# (contact_received, invitation_created), so a notification exists if and
+# only if its change committed, and the request costs one extra INSERT.
+#
+# A background thread in each process sends due messages: it leases a
+# batch (so other workers skip it), sends the emails over one SMTP
+# connection and the webhook events in one POST, then marks them sent. A
+# failed message is retried after NOTIFICATION_RETRY_BASE * 2 ** attempts
+# seconds (with jitter, capped at NOTIFICATION_RETRY_MAX) and marked failed
+# after NOTIFICATION_MAX_ATTEMPTS. The worker is woken when a transaction
+# that wrote messages commits, and polls every NOTIFICATION_POLL_INTERVAL
+# seconds for retries and for messages other processes left behind.
+#
+# Email goes through Django's EMAIL_BACKEND. For local testing, the
+# notification_sink management command runs an SMTP server and a webhook
+# receiver that print what they get.
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import threading
+import urllib.request
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_SIGNATURE_HEADER = 'X-Webhook-Signature'
+
+_worker = None
+_worker_pid = None
+_worker_lock = threading.Lock()
+_worker_wakeup = threading.Event()
+
+
+def site_url(path):
+    return settings.SITE_URL.rstrip('/') + path
+
+
+def add(event, data, emails=()):
+    """Queue an event for the webhook and an email per ``(to, subject, body)``.
+
+    Call inside the transaction that makes the change; the worker is woken
+    once it commits.
+    """
+    messages = [
+        OutboxMessage(channel=OutboxMessage.EMAIL, event=event,
+                      payload={'to': list(to), 'subject': subject, 'body': body})
+        for to, subject, body in emails if to
+    ]
+    if settings.NOTIFICATION_WEBHOOK_URL:
+        messages.append(OutboxMessage(
+            channel=OutboxMessage.WEBHOOK, event=event, payload={'event': event, 'data': data},
+        ))
+    if messages:
+        OutboxMessage.objects.bulk_create(messages)
+        transaction.on_commit(wake)
+
+
+def contact_received(contacts):
+    """Notify the site owner of new contact form messages."""
+    for contact in contacts:
+        add('contact.created', {
+            'id': contact.pk,
+            'name': contact.name,
+            'email': contact.email,
+            'message': contact.message,
+            'created_at': contact.created_at.isoformat() if contact.created_at else None,
+        }, emails=[(
+            settings.NOTIFICATION_EMAILS,
+            f'New message from {contact.name}',
+            f'{contact.name} <{contact.email}> wrote:\n\n{contact.message}\n\n'
+            f'Reply from the admin inbox: {site_url("/admin/messages")}',
+        )])
+
+
+def invitation_created(invitation):
+    """Send an admin invitation to the invitee."""
+    link = site_url(f'/admin/signup?code={invitation.invite_code}')
+    add('invitation.created', {
+        'id': invitation.pk,
+        'email': invitation.email,
+        'role': invitation.role.name,
+        'expires_at': invitation.expires_at.isoformat(),
+    }, emails=[(
+        [invitation.email],
+        "You've been invited to manage the site",
+        f'You have been invited to join the site admin as {invitation.role.name}.\n\n'
+        f'Accept the invitation: {link}\n'
+        f'Invitation code: {invitation.invite_code}\n\n'
+        f'The invitation expires on {invitation.expires_at:%Y-%m-%d %H:%M} UTC.',
+    )])
+
+
+def claim(limit):
+    """Lease up to ``limit`` due messages to this worker."""
+    now = timezone.now()
+    lease = now + timedelta(seconds=settings.NOTIFICATION_LEASE)
+    with transaction.atomic():
+        due = (
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxMessage.PENDING, available_at__lte=now)
+            .order_by('available_at', 'id')
+        )
+        ids = list(due.values_list('id', flat=True)[:limit])
+        # Until the lease runs out, other workers treat these as not due. The
+        # filter repeats the due check for databases without row locks.
+        OutboxMessage.objects.filter(id__in=ids, status=OutboxMessage.PENDING, available_at__lte=now).update(
+            available_at=lease, attempts=F('attempts') + 1,
+        )
+    return list(OutboxMessage.objects.filter(id__in=ids, available_at=lease).order_by('id'))
+
+
+def send_emails(messages):
+    """Send over one connection. Returns ``{message id: error}`` for the failures."""
+    errors = {}
+    try:
+        with get_connection() as connection:
+            for message in messages:
+                payload = message.payload
+                try:
+                    EmailMessage(payload['subject'], payload['body'], to=payload['to'], connection=connection).send()
+                except Exception as exc:
+                    errors[message.pk] = exc
+    except Exception as exc:
+        # Couldn't connect (or close): retry whatever wasn't sent
+        errors.update((message.pk, exc) for message in messages if message.pk not in errors)
+    return errors
+
+
+def send_webhooks(messages):
+    """POST all events in one request. Returns ``{message id: error}`` for the failures."""
+    body = json.dumps({'events': [{'id': message.pk, **message.payload} for message in messages]}).encode()
+    request = urllib.request.Request(
+        settings.NOTIFICATION_WEBHOOK_URL, data=body, method='POST', headers={'Content-Type': 'application/json'},
+    )
+    if settings.NOTIFICATION_WEBHOOK_SECRET:
+        signature = hmac.new(settings.NOTIFICATION_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+        request.add_header(WEBHOOK_SIGNATURE_HEADER, f'sha256={signature}')
+    try:
+        with urllib.request.urlopen(request, timeout=settings.NOTIFICATION_TIMEOUT):
+            return {}
+    except Exception as exc:
+        return {message.pk: exc for message in messages}
+
+
+def retry_delay(attempts):
+    delay = min(settings.NOTIFICATION_RETRY_BASE * 2 ** (attempts - 1), settings.NOTIFICATION_RETRY_MAX)
+    # Jitter, so messages that failed together don't all retry together
+    return timedelta(seconds=delay * random.uniform(0.5, 1))
+
+
+def send_batch():
+    """Send one batch of due messages. Returns the number of messages attempted."""
+    messages = claim(settings.NOTIFICATION_BATCH_SIZE)
+    if not messages:
+        return 0
+    emails = [message for message in messages if message.channel == OutboxMessage.EMAIL]
+    webhooks = [message for message in messages if message.channel == OutboxMessage.WEBHOOK]
+    errors = {}
+    if emails:
+        errors.update(send_emails(emails))
+    if webhooks:
+        if settings.NOTIFICATION_WEBHOOK_URL:
+            errors.update(send_webhooks(webhooks))
+        else:
+            errors.update((message.pk, 'NOTIFICATION_WEBHOOK_URL is not set') for message in webhooks)
+
+    now = timezone.now()
+    sent = [message.pk for message in messages if message.pk not in errors]
+    OutboxMessage.objects.filter(pk__in=sent).update(status=OutboxMessage.SENT, sent_at=now, last_error='')
+    for message in messages:
+        error = errors.get(message.pk)
+        if error is None:
+            continue
+        logger.warning('Could not send %s %s (attempt %d): %s', message.channel, message.event, message.attempts, error)
+        if message.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+            changes = {'status': OutboxMessage.FAILED}
+        else:
+            changes = {'available_at': now + retry_delay(message.attempts)}
+        OutboxMessage.objects.filter(pk=message.pk).update(last_error=str(error), **changes)
+    return len(messages)
+
+
+def send_due():
+    """Send every due message. Returns the number attempted."""
+    attempted = 0
+    while True:
+        count = send_batch()
+        attempted += count
+        if count < settings.NOTIFICATION_BATCH_SIZE:
+            return attempted
+
+
+def purge():
+    """Delete sent messages older than NOTIFICATION_RETENTION seconds."""
+    cutoff = timezone.now() - timedelta(seconds=settings.NOTIFICATION_RETENTION)
+    OutboxMessage.objects.filter(status=OutboxMessage.SENT, sent_at__lt=cutoff).delete()
+
+
+def run_worker():
+    last_purge = None
+    while True:
+        _worker_wakeup.wait(settings.NOTIFICATION_POLL_INTERVAL)
+        _worker_wakeup.clear()
+        try:
+            send_due()
+            if last_purge is None or timezone.now() - last_purge > timedelta(hours=1):
+                purge()
+                last_purge = timezone.now()
+        except Exception:
+            logger.exception('Sending notifications failed')
+        finally:
+            # The worker thread is long-lived; don't leave its connection open
+            connections.close_all()
+
+
+def ensure_worker():
+    """Start this process's sending thread if it isn't running."""
+    global _worker, _worker_pid
+    with _worker_lock:
+        # Threads don't survive a fork (e.g. gunicorn --preload); start a new one
+        if _worker is None or _worker_pid != os.getpid() or not _worker.is_alive():
+            _worker = threading.Thread(target=run_worker, name='outbox', daemon=True)
+            _worker.start()
+            _worker_pid = os.getpid()
+
+
+def wake():
+    if settings.NOTIFICATIONS_ASYNC:
+        ensure_worker()
+        _worker_wakeup.set()
+    else:
+        send_due()
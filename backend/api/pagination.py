@@ -0,0 +1,160 @@
+# backend/api/pagination.py
+# Keyset pagination for the admin and public lists.
+#
+# PageNumberPagination runs an exact COUNT(*) and an OFFSET scan for every
+# page, so deep pages get slower the further they are. KeysetPagination seeks
+# straight to the position after the last row seen, using the
+# (created_at, id) index, and reports an estimated count in a header.
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+ESTIMATED_COUNT_HEADER = 'X-Estimated-Count'
+# Largest exact count taken where the database can't estimate
+ESTIMATED_COUNT_LIMIT = 10000
+
+
+def estimate_count(queryset):
+    """Return an approximate row count for a queryset without counting it.
+
+    PostgreSQL's planner estimate is used when available; other databases
+    count up to ESTIMATED_COUNT_LIMIT rows.
+    """
+    queryset = queryset.order_by()
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    return queryset[:ESTIMATED_COUNT_LIMIT].count()
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Opt-in keyset pagination on ``(created_at, id)``, newest first.
+
+    Requests without a ``cursor`` parameter are paginated by page number as
+    before. Pass ``?cursor=`` (empty) for the first page, then follow the
+    ``next``/``previous`` links. Every page costs one indexed query however
+    deep it is, and the total is reported in the ``X-Estimated-Count``
+    header instead of an exact ``count``.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('created_at', 'id')
+    estimated_count_header = ESTIMATED_COUNT_HEADER
+
+    def wants_keyset(self, request):
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_keyset = self.wants_keyset(request)
+        if not self.use_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        reverse, position = self.decode_cursor(request.query_params.get(self.cursor_query_param, ''))
+        if self.estimated_count_header:
+            self.estimated_count = estimate_count(queryset)
+
+        created_field, id_field = self.ordering
+        if position is None:
+            rows = queryset.order_by(f'-{created_field}', f'-{id_field}')
+        elif reverse:
+            rows = queryset.filter(
+                Q(**{f'{created_field}__gt': position[0]})
+                | Q(**{created_field: position[0], f'{id_field}__gt': position[1]})
+            ).order_by(created_field, id_field)
+        else:
+            rows = queryset.filter(
+                Q(**{f'{created_field}__lt': position[0]})
+                | Q(**{created_field: position[0], f'{id_field}__lt': position[1]})
+            ).order_by(f'-{created_field}', f'-{id_field}')
+
+        rows = list(rows[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_position = self.previous_position = None
+        if rows:
+            # Coming back from a later page there is always a next page; going
+            # forward there is a previous page unless this is the first one.
+            if has_more or reverse:
+                self.next_position = self.position_of(rows[-1])
+            if (has_more and reverse) or (position is not None and not reverse):
+                self.previous_position = self.position_of(rows[0])
+        return rows
+
+    def position_of(self, instance):
+        created_field, id_field = self.ordering
+        return getattr(instance, created_field), getattr(instance, id_field)
+
+    def encode_cursor(self, reverse, position):
+        created_at, pk = position
+        raw = f'{"p" if reverse else "n"}|{created_at.isoformat()}|{pk}'
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, value):
+        """Return ``(reverse, position)``; position is None for the first page."""
+        if not value:
+            return False, None
+        try:
+            direction, created_at, pk = base64.urlsafe_b64decode(value.encode()).decode().split('|')
+            if direction not in ('n', 'p'):
+                raise ValueError(direction)
+            return direction == 'p', (datetime.fromisoformat(created_at), int(pk))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound('Invalid cursor.')
+
+    def get_cursor_link(self, reverse, position):
+        if position is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, self.encode_cursor(reverse, position))
+
+    def get_paginated_response(self, data):
+        if not self.use_keyset:
+            return super().get_paginated_response(data)
+        response = Response({
+            'next': self.get_cursor_link(False, self.next_position),
+            'previous': self.get_cursor_link(True, self.previous_position),
+            'results': data,
+        })
+        if self.estimated_count_header:
+            response[self.estimated_count_header] = str(self.estimated_count)
+        return response
+
+
+class PublicListPagination(KeysetPagination):
+    """
+    Keyset pages for the public lists, which stay unpaginated by default.
+
+    ``?limit=`` and/or ``?cursor=`` return ``{next, previous, results}``
+    pages; no count is reported.
+    """
+    page_size_query_param = 'limit'
+    estimated_count_header = None
+
+    def wants_keyset(self, request):
+        return self.cursor_query_param in request.query_params or self.page_size_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.wants_keyset(request):
+            self.use_keyset = False
+            return None
+        return super().paginate_queryset(queryset, request, view)
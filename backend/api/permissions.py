@@ -0,0 +1,42 @@
+# backend/api/permissions.py
+
+from rest_framework.permissions import BasePermission, SAFE_METHODS
+
+
+class RequiresPermission(BasePermission):
+    """
+    Allows access to active admin users whose role grants ``permission``.
+    Read-only requests are also allowed with ``read_permission``.
+
+    Without a permission, any active admin user is allowed. Use an instance
+    directly in ``permission_classes``:
+
+        permission_classes = [IsAuthenticated, RequiresPermission('manage_projects', 'view_projects')]
+    """
+    message = 'You do not have permission to perform this action.'
+
+    def __init__(self, permission=None, read_permission=None):
+        self.permission = permission
+        self.read_permission = read_permission
+
+    def __call__(self):
+        # DRF instantiates each entry of permission_classes; hand back the configured instance.
+        return self
+
+    def has_permission(self, request, view):
+        get_admin_user = getattr(request.user, 'get_admin_user', None)
+        if get_admin_user is None:
+            return False
+        from .models import AdminUser
+        try:
+            admin_user = get_admin_user()
+        except AdminUser.DoesNotExist:
+            return False
+        if not admin_user.is_active:
+            return False
+        if self.permission is None:
+            return True
+        permissions = admin_user.role.get_permission_set()
+        if request.method in SAFE_METHODS and self.read_permission in permissions:
+            return True
+        return self.permission in permissions
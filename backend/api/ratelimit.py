@@ -0,0 +1,266 @@
+# backend/api/ratelimit.py
+# Token-bucket rate limiting for the public write endpoints.
+#
+# Each view decorated with @rate_limit('<scope>') is limited by the rules in
+# settings.RATE_LIMITS['<scope>'], e.g. "ip:5/m" (a bucket per client IP
+# holding 5 tokens, refilled at 5 per minute) or "key:3/h" (a bucket per
+# value of the view's key, such as the email or invite code submitted). A
+# request takes one token from every bucket it falls in, or from none if any
+# of them is empty, in which case it gets a 429 with Retry-After.
+#
+# The check wraps the whole view, so a rejected request never reaches DRF,
+# authentication or the database. Every response carries RateLimit-Limit,
+# RateLimit-Remaining, RateLimit-Reset and RateLimit-Policy headers.
+#
+# With the Redis cache backend, buckets are shared by all workers and
+# updated in a single Lua script, so concurrent requests can't both spend
+# the last token. Other backends (and Redis outages) fall back to buckets
+# kept in the memory of each process.
+
+import functools
+import hashlib
+import ipaddress
+import json
+import logging
+import math
+import re
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.http import JsonResponse
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+RULE_RE = re.compile(r'^(ip|key):(\d+)/(\d*)([smhd])$')
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 60 * 60 * 24}
+# Requests exempt from limits (CORS preflights)
+EXEMPT_METHODS = ('OPTIONS',)
+# Process-local buckets kept before idle (full) ones are dropped
+MEMORY_BUCKETS_MAX = 10000
+
+
+class Rule(namedtuple('Rule', 'kind capacity period')):
+    """``capacity`` tokens per bucket, refilled evenly over ``period`` seconds."""
+
+    @property
+    def rate(self):
+        return self.capacity / self.period
+
+    @property
+    def policy(self):
+        return f'{self.capacity};w={self.period}'
+
+
+@functools.lru_cache(maxsize=None)
+def parse_rule(value):
+    """Parse ``"<ip|key>:<requests>/<period>"``, where period is e.g. ``m`` or ``10m``."""
+    match = RULE_RE.match(value.replace(' ', ''))
+    if not match:
+        raise ValueError(f'Invalid rate limit rule {value!r}')
+    kind, capacity, multiplier, unit = match.groups()
+    return Rule(kind, int(capacity), int(multiplier or 1) * PERIODS[unit])
+
+
+def client_ip(request):
+    """The client address, with IPv6 clients grouped by /64 (one bucket per network)."""
+    value = request.META.get(settings.RATE_LIMIT_IP_META_KEY) or request.META.get('REMOTE_ADDR', '')
+    value = value.split(',')[0].strip()
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError:
+        return value
+    if address.version == 6:
+        return str(ipaddress.ip_network(f'{address}/64', strict=False).network_address)
+    return str(address)
+
+
+def request_data(request):
+    """The submitted JSON or form fields, without consuming the body for the view."""
+    content_type = request.content_type or ''
+    try:
+        if content_type == 'application/json':
+            data = json.loads(request.body or b'{}')
+            return data if isinstance(data, dict) else {}
+        if content_type == 'application/x-www-form-urlencoded':
+            return {name: values[-1] for name, values in parse_qs(request.body.decode()).items()}
+    except ValueError:
+        pass
+    # Multipart bodies are left for the view to parse; only the IP rules apply
+    return {}
+
+
+def body_field(name):
+    """Key requests by a submitted field, e.g. ``body_field('email')``."""
+    def key(request):
+        value = request_data(request).get(name)
+        return str(value).strip().lower() if value else None
+    return key
+
+
+def query_param(name):
+    """Key requests by a query string parameter, e.g. ``query_param('code')``."""
+    def key(request):
+        return request.GET.get(name, '').strip().lower() or None
+    return key
+
+
+class MemoryBuckets:
+    """Buckets in this process's memory, for cache backends without atomic scripts."""
+
+    def __init__(self):
+        # One lock around a few float operations; CPython offers no compare-and-swap
+        self.lock = threading.Lock()
+        self.buckets = {}
+
+    def take(self, buckets):
+        now = time.monotonic()
+        with self.lock:
+            levels = []
+            for key, rule in buckets:
+                tokens, updated = self.buckets.get(key, (rule.capacity, now))
+                levels.append(min(rule.capacity, tokens + (now - updated) * rule.rate))
+            allowed = all(level >= 1 for level in levels)
+            if allowed:
+                levels = [level - 1 for level in levels]
+            for (key, _rule), level in zip(buckets, levels):
+                self.buckets[key] = (level, now)
+            if len(self.buckets) > MEMORY_BUCKETS_MAX:
+                self.prune(now)
+        return allowed, levels
+
+    def prune(self, now):
+        # Buckets idle for a day have refilled and are the same as new ones
+        for key, (_tokens, updated) in list(self.buckets.items()):
+            if now - updated > PERIODS['d']:
+                del self.buckets[key]
+        if len(self.buckets) > MEMORY_BUCKETS_MAX:
+            self.buckets.clear()
+
+
+# KEYS: the buckets. ARGV: capacity and refill rate (tokens/second) of each.
+# Refills every bucket to the current time and takes a token from each if all
+# of them have one. Returns {allowed, level of each bucket}.
+TAKE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local levels = {}
+local allowed = 1
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local rate = tonumber(ARGV[i * 2])
+    local state = redis.call('HMGET', key, 'tokens', 'updated')
+    local tokens = capacity
+    if state[1] then
+        tokens = math.min(capacity, tonumber(state[1]) + math.max(0, now - tonumber(state[2])) * rate)
+    end
+    if tokens < 1 then
+        allowed = 0
+    end
+    levels[i] = tokens
+end
+local result = {allowed}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local rate = tonumber(ARGV[i * 2])
+    local tokens = levels[i] - allowed
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'updated', tostring(now))
+    -- Expire once the bucket would be full again
+    redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+    result[i + 1] = tostring(tokens)
+end
+return result
+"""
+
+
+_take_script = None
+
+
+def take_redis(backend, buckets):
+    """Run TAKE_SCRIPT for the buckets on a Redis cache backend."""
+    global _take_script
+    keys = [backend.make_and_validate_key(key) for key, _rule in buckets]
+    args = []
+    for _key, rule in buckets:
+        args += [rule.capacity, repr(rule.rate)]
+    client = backend._cache.get_client(keys[0], write=True)
+    if _take_script is None:
+        # Sent with EVALSHA, so the script body only crosses the wire once per server
+        _take_script = client.register_script(TAKE_SCRIPT)
+    allowed, *levels = _take_script(keys=keys, args=args, client=client)
+    return bool(allowed), [float(level) for level in levels]
+
+
+memory_buckets = MemoryBuckets()
+
+
+def take(buckets):
+    """Take a token from every bucket, or none. Returns ``(allowed, levels)``."""
+    if not buckets:
+        return True, []
+    backend = caches['default']
+    if isinstance(backend, RedisCache):
+        try:
+            return take_redis(backend, buckets)
+        except RedisError as exc:
+            logger.warning('Rate limiting falls back to process memory: %s', exc)
+    return memory_buckets.take(buckets)
+
+
+def bucket_key(scope, rule, value):
+    digest = hashlib.sha256(value.encode()).hexdigest()[:32]
+    return f'ratelimit:{scope}:{rule.kind}:{rule.capacity}/{rule.period}:{digest}'
+
+
+def rate_limit_headers(rules, levels):
+    """RateLimit-* headers for the bucket closest to running out."""
+    rule, level = min(zip(rules, levels), key=lambda pair: pair[1] / pair[0].capacity)
+    level = max(level, 0)
+    return {
+        'RateLimit-Limit': str(rule.capacity),
+        'RateLimit-Remaining': str(math.floor(level)),
+        'RateLimit-Reset': str(math.ceil((rule.capacity - level) / rule.rate)),
+        'RateLimit-Policy': ', '.join(dict.fromkeys(r.policy for r in rules)),
+    }
+
+
+def rate_limit(scope, key=None):
+    """Limit a view by the token buckets configured in ``settings.RATE_LIMITS[scope]``.
+
+    ``key`` returns the value "key" rules are counted by for a request (see
+    body_field and query_param); when it returns None only the IP rules apply.
+    Decorate function views above @api_view, and class-based views with
+    ``@method_decorator(rate_limit(...), name='dispatch')``.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            rules = [parse_rule(rule) for rule in settings.RATE_LIMITS.get(scope, ())]
+            if not settings.RATE_LIMIT_ENABLED or not rules or request.method in EXEMPT_METHODS:
+                return view(request, *args, **kwargs)
+
+            values = {'ip': client_ip(request), 'key': key(request) if key else None}
+            applied = [rule for rule in rules if values[rule.kind]]
+            allowed, levels = take([(bucket_key(scope, rule, values[rule.kind]), rule) for rule in applied])
+            headers = rate_limit_headers(applied, levels) if applied else {}
+
+            if allowed:
+                response = view(request, *args, **kwargs)
+            else:
+                retry_after = max(
+                    math.ceil((1 - level) / rule.rate) for rule, level in zip(applied, levels) if level < 1
+                )
+                response = JsonResponse(
+                    {'detail': f'Too many requests. Try again in {retry_after} seconds.'}, status=429,
+                )
+                response['Retry-After'] = str(retry_after)
+            for name, value in headers.items():
+                response[name] = value
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,69 @@
+# backend/api/renderers.py
+# JSON renderer and parser built on orjson, with DRF's stock JSONRenderer/
+# JSONParser behavior as a fallback when orjson isn't installed.
+#
+# Output matches JSONRenderer with the default settings (compact, UTF-8,
+# U+2028/U+2029 escaped). Anything orjson doesn't encode natively, such as
+# Decimal, lazy translation strings and querysets, and all dates and times
+# (so their format is unchanged) go through DRF's JSONEncoder.default.
+
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps(data):
+    """Encode ``data`` as compact UTF-8 JSON bytes, like JSONRenderer does."""
+    if orjson is not None:
+        ret = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    else:
+        ret = _encoder.encode(data).encode('utf-8')
+    # U+2028/U+2029 are valid in JSON but not in JavaScript string literals
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class ORJSONRenderer(JSONRenderer):
+    """A drop-in replacement for JSONRenderer that encodes with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        # orjson only indents by two spaces; leave indented output to JSONRenderer
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class ORJSONParser(JSONParser):
+    """A drop-in replacement for JSONParser that decodes with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                body = body.decode(encoding)
+            # Like JSONParser in strict mode, NaN and Infinity are rejected
+            return orjson.loads(body)
+        except (ValueError, LookupError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
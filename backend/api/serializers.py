@@ -1,7 +1,14 @@
 # backend/portfolio/serializers.py
 
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models
+from django.utils import timezone
+from django.utils.encoding import filepath_to_uri
 from rest_framework import serializers
+from .fieldsets import SparseFieldsSerializerMixin
 from .models import (
+    ImageVariantsField as ImageVariantsModelField,
     Project,
     Skill,
     Experience,
@@ -15,11 +22,22 @@ from .models import (
     AdminRole,
     AdminUser,
     AdminInvitation,
+    ChunkedUpload,
 )
 
+# --- Image variants ---
+class ImageVariantsField(serializers.ReadOnlyField):
+    """An image's responsive variants, with storage names turned into absolute URLs."""
+
+    def to_representation(self, value):
+        image_field = self.parent.Meta.model._meta.get_field(self.source.removesuffix('_variants'))
+        return variants_url_builder(image_field.storage, self.context.get('request'))(value)
+
 # --- Core Portfolio Serializers ---
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     # The frontend should upload project images using the 'image' key in form data.
+    image_variants = ImageVariantsField()
+
     class Meta:
         model = Project
         fields = '__all__'
@@ -52,12 +70,14 @@ class ProjectSerializer(serializers.ModelSerializer):
             validated_data['image'] = image
         return super().update(instance, validated_data)
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Skill
         fields = '__all__'
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    company_logo_variants = ImageVariantsField()
+
     class Meta:
         model = Experience
         fields = '__all__'
@@ -75,7 +95,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
             validated_data['company_logo'] = image
         return super().update(instance, validated_data)
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Education
         fields = '__all__'
@@ -92,8 +112,10 @@ class EducationSerializer(serializers.ModelSerializer):
             validated_data['certificate'] = certificate
         return super().update(instance, validated_data)
 
-class AboutSerializer(serializers.ModelSerializer):
+class AboutSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     # The frontend should upload profile pictures using the 'profile_picture' key and resumes using the 'resume' key in form data.
+    profile_picture_variants = ImageVariantsField()
+
     class Meta:
         model = About
         fields = '__all__'
@@ -118,13 +140,21 @@ class AboutSerializer(serializers.ModelSerializer):
 
 
 # --- Communication Serializers ---
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Contact
         fields = '__all__'
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class PublicContactSerializer(serializers.ModelSerializer):
+    """The contact form: spam scoring and queue fields stay on the admin side."""
+    class Meta:
+        model = Contact
+        fields = ['id', 'name', 'email', 'message', 'created_at']
+
+class TestimonialSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     # The frontend should upload testimonial images using the 'image' key in form data.
+    image_variants = ImageVariantsField()
+
     class Meta:
         model = Testimonial
         fields = '__all__'
@@ -143,7 +173,10 @@ class TestimonialSerializer(serializers.ModelSerializer):
 
 
 # --- Configuration Serializers ---
-class SettingSerializer(serializers.ModelSerializer):
+class SettingSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    site_logo_variants = ImageVariantsField()
+    site_favicon_variants = ImageVariantsField()
+
     class Meta:
         model = Setting
         fields = '__all__'
@@ -166,7 +199,7 @@ class SettingSerializer(serializers.ModelSerializer):
             validated_data['site_favicon'] = site_favicon
         return super().update(instance, validated_data)
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = '__all__'
@@ -225,7 +258,201 @@ class AcceptInvitationSerializer(serializers.Serializer):
             raise serializers.ValidationError("Invalid invitation code.")
         return value
 
-class SocialLinkSerializer(serializers.ModelSerializer):
+class SocialLinkSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = SocialLink
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+# --- Upload Serializers ---
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChunkedUpload
+        fields = ['id', 'field_name', 'filename', 'size', 'checksum', 'offset', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'offset', 'created_at', 'updated_at']
+
+    def validate_size(self, value):
+        max_size = settings.CHUNKED_UPLOAD_MAX_SIZE
+        if value < 1 or value > max_size:
+            raise serializers.ValidationError(f"Size must be between 1 and {max_size} bytes.")
+        return value
+
+    def validate_checksum(self, value):
+        value = value.lower()
+        if value and (len(value) != 64 or any(c not in '0123456789abcdef' for c in value)):
+            raise serializers.ValidationError("Checksum must be a hex SHA-256 digest.")
+        return value
+
+    def validate_field_name(self, value):
+        if value not in self.context.get('upload_fields', ()):
+            raise serializers.ValidationError(f'"{value}" does not accept chunked uploads.')
+        return value
+
+# --- Read-only Serializers (public API) ---
+class ReadSerializer:
+    """
+    A lightweight, read-only stand-in for a ``fields = '__all__'``
+    ModelSerializer. Querysets are read with ``values_list()`` so no model
+    instances are built, values are formatted exactly as DRF would format
+    them, and media URLs are joined to a prefix computed once per call.
+    Accepts the same ``(instance, many=..., context=...)`` arguments as a
+    DRF serializer and exposes ``.fields`` and ``.data``. A ``fields``
+    collection in the context limits the output (and the columns read).
+    """
+    model = None
+
+    def __init__(self, instance=None, many=False, context=None, **kwargs):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+
+    @classmethod
+    def get_model_fields(cls):
+        """Return every serializable model field, in ModelSerializer order."""
+        fields = cls.__dict__.get('_model_fields')
+        if fields is None:
+            fields = [field for field in cls.model._meta.concrete_fields]
+            cls._model_fields = fields
+        return fields
+
+    @property
+    def fields(self):
+        selected = self.context.get('fields')
+        return {
+            field.name: field for field in self.get_model_fields()
+            if selected is None or field.name in selected
+        }
+
+    def get_converters(self, fields):
+        converters = []
+        request = self.context.get('request')
+        for field in fields:
+            if isinstance(field, models.DateTimeField):
+                converters.append(datetime_formatter())
+            elif isinstance(field, models.DateField):
+                converters.append(format_date)
+            elif isinstance(field, models.FileField):
+                converters.append(media_url_builder(field.storage, request))
+            elif isinstance(field, ImageVariantsModelField):
+                image_field = field.model._meta.get_field(field.name.removesuffix('_variants'))
+                converters.append(variants_url_builder(image_field.storage, request))
+            else:
+                converters.append(None)
+        return converters
+
+    def to_representation(self, instances):
+        fields = list(self.fields.values())
+        names = [field.name for field in fields]
+        converters = [
+            (index, converter) for index, converter in enumerate(self.get_converters(fields)) if converter is not None
+        ]
+        data = []
+        for row in self.get_rows(instances, fields):
+            row = list(row)
+            for index, converter in converters:
+                row[index] = converter(row[index])
+            data.append(dict(zip(names, row)))
+        return data
+
+    def get_rows(self, instances, fields):
+        attnames = [field.attname for field in fields]
+        if isinstance(instances, models.QuerySet):
+            return instances.values_list(*attnames)
+        # Model instances, e.g. a page; file fields are read by name
+        return (
+            [getattr(instance, attname) for attname in attnames]
+            for instance in instances
+        )
+
+    @property
+    def data(self):
+        if self.many:
+            return self.to_representation(self.instance)
+        return self.to_representation([self.instance])[0]
+
+
+def datetime_formatter():
+    """Return a function formatting datetimes like DRF's DateTimeField (ISO 8601, current time zone)."""
+    # Looked up once: get_current_timezone() goes through a thread-local per call
+    current_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def format_datetime(value):
+        if not value:
+            return None
+        if current_timezone is not None and value.tzinfo is not None:
+            value = value.astimezone(current_timezone)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return format_datetime
+
+
+def format_date(value):
+    return value.isoformat() if value else None
+
+
+def media_url_builder(storage, request):
+    """Return a function turning a stored file name into the URL DRF's FileField would output."""
+    if isinstance(storage, FileSystemStorage):
+        base_url = storage.base_url
+        if request is not None:
+            base_url = request.build_absolute_uri(base_url)
+
+        def build(name):
+            if not name:
+                return None
+            return base_url + filepath_to_uri(str(name)).lstrip('/')
+        return build
+
+    def build(name):
+        if not name:
+            return None
+        url = storage.url(str(name))
+        return request.build_absolute_uri(url) if request is not None else url
+    return build
+
+
+def variants_url_builder(storage, request):
+    """Return a function formatting an image variants value for output."""
+    build_url = media_url_builder(storage, request)
+
+    def build(meta):
+        if not meta:
+            return {}
+        data = {key: meta[key] for key in ('status', 'width', 'height', 'color', 'placeholder') if key in meta}
+        if 'sources' in meta:
+            data['sources'] = [
+                {'type': source['type'], 'width': source['width'], 'height': source['height'],
+                 'url': build_url(source['name'])}
+                for source in meta['sources']
+            ]
+        return data
+    return build
+
+
+class ProjectReadSerializer(ReadSerializer):
+    model = Project
+
+class SkillReadSerializer(ReadSerializer):
+    model = Skill
+
+class ExperienceReadSerializer(ReadSerializer):
+    model = Experience
+
+class EducationReadSerializer(ReadSerializer):
+    model = Education
+
+class AboutReadSerializer(ReadSerializer):
+    model = About
+
+class TestimonialReadSerializer(ReadSerializer):
+    model = Testimonial
+
+class SocialLinkReadSerializer(ReadSerializer):
+    model = SocialLink
+
+class SettingReadSerializer(ReadSerializer):
+    model = Setting
+
+class ServiceReadSerializer(ReadSerializer):
+    model = Service
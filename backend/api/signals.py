@@ -0,0 +1,91 @@
+# backend/api/signals.py
+# Bump the cache revision of site content whenever it is saved or deleted.
+# Revisions back both the public response cache and the ETags of the
+# public and admin read endpoints. AdminUser and AdminRole revisions
+# invalidate the cached admin principal used by authenticated requests.
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+
+from .analytics import CONTENT_MODELS, TRACKED_MODELS, record_change, record_content_change
+from .cache import bump_revision
+from .images import IMAGE_FIELDS, delete_image_variants, queue_changed_images
+from .spam import queue_new_contact
+from .models import (
+    Project,
+    Skill,
+    Experience,
+    About,
+    Education,
+    Contact,
+    Testimonial,
+    SocialLink,
+    Setting,
+    Service,
+    AdminRole,
+    AdminUser,
+)
+
+CACHED_MODELS = (
+    Project,
+    Skill,
+    Experience,
+    About,
+    Education,
+    Contact,
+    Testimonial,
+    SocialLink,
+    Setting,
+    Service,
+    AdminRole,
+    AdminUser,
+)
+
+
+def invalidate_cached_content(sender, **kwargs):
+    # Wait for the commit so no reader can cache the old rows under the new revision.
+    transaction.on_commit(lambda: bump_revision(sender))
+
+
+for model in CACHED_MODELS:
+    post_save.connect(invalidate_cached_content, sender=model, dispatch_uid=f'cache-save-{model._meta.label_lower}')
+    post_delete.connect(invalidate_cached_content, sender=model, dispatch_uid=f'cache-delete-{model._meta.label_lower}')
+
+
+def count_created(sender, instance, created, **kwargs):
+    if created:
+        record_change(COUNTED_METRICS[sender], instance, 1)
+
+
+def count_deleted(sender, instance, **kwargs):
+    record_change(COUNTED_METRICS[sender], instance, -1)
+
+
+# Keep the dashboard counters in step, in the same transaction as the change.
+COUNTED_METRICS = {model: metric for metric, model in TRACKED_MODELS.items()}
+
+for model in COUNTED_METRICS:
+    post_save.connect(count_created, sender=model, dispatch_uid=f'count-save-{model._meta.label_lower}')
+    post_delete.connect(count_deleted, sender=model, dispatch_uid=f'count-delete-{model._meta.label_lower}')
+
+
+def count_content_change(sender, **kwargs):
+    record_content_change(CONTENT_NAMES[sender])
+
+
+# Hourly/daily rollups of content edits for the time-series API.
+CONTENT_NAMES = {model: name for name, model in CONTENT_MODELS.items()}
+
+for model in CONTENT_NAMES:
+    post_save.connect(count_content_change, sender=model, dispatch_uid=f'change-save-{model._meta.label_lower}')
+    post_delete.connect(count_content_change, sender=model, dispatch_uid=f'change-delete-{model._meta.label_lower}')
+
+
+# Generate responsive variants of uploaded images in the background.
+for model in IMAGE_FIELDS:
+    post_save.connect(queue_changed_images, sender=model, dispatch_uid=f'images-save-{model._meta.label_lower}')
+    pre_delete.connect(delete_image_variants, sender=model, dispatch_uid=f'images-delete-{model._meta.label_lower}')
+
+
+# Score new contact messages for spam and near-duplicates in the background.
+post_save.connect(queue_new_contact, sender=Contact, dispatch_uid='spam-save-api.contact')
@@ -0,0 +1,178 @@
+# backend/api/spam.py
+# Background spam and near-duplicate scoring of contact messages.
+#
+# Once a Contact is committed (from the form, or in a batch from the
+# ingestion queue), its id is queued and scored off the request path on a
+# single background thread. The score combines local heuristics:
+#
+#   - links: how many URLs the message has and how much of it they make up
+#   - duplicate: a near-copy of an earlier message, found through the
+#     MinHash/LSH buckets in ContactFingerprint (see api/minhash.py), so
+#     only messages sharing a bucket are compared, never every pair
+#   - rate: messages from the same email in the previous 24 hours
+#   - shouting and very short messages
+#
+# Each signal is a probability-like weight and they are combined as
+# 1 - (1 - w1)(1 - w2)..., so the score stays in [0, 1]. Contact.spam_score,
+# spam_reasons and duplicate_of are written with a queryset update, so
+# scoring sends no signals. The admin list filters on the score through
+# the contact_spam_idx index.
+#
+# Set SPAM_SCORING_ASYNC = False to score inline after the commit instead.
+# The score_contacts management command scores anything left unscored.
+
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from .cache import bump_revision
+from .minhash import buckets, jaccard, shingles, signature
+from .models import Contact, ContactFingerprint
+
+logger = logging.getLogger(__name__)
+
+# Messages scoring at least this are treated as spam by ?spam=true/false
+SPAM_THRESHOLD = 0.5
+# Shingle overlap above which a message counts as a copy of an earlier one
+DUPLICATE_SIMILARITY = 0.7
+# Near-duplicate candidates compared exactly per message, most recent first
+MAX_CANDIDATES = 50
+RATE_WINDOW = timedelta(hours=24)
+
+URL_RE = re.compile(r'(?:https?://|www\.)\S+', re.IGNORECASE)
+WORD_RE = re.compile(r'\w+')
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor, _executor_pid
+    with _executor_lock:
+        # Threads don't survive a fork (e.g. gunicorn --preload); start a new pool
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spam')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def combine(weights):
+    remaining = 1.0
+    for weight in weights:
+        remaining *= 1 - weight
+    return round(1 - remaining, 3)
+
+
+def find_duplicate(contact, shingle_set, contact_buckets):
+    """The earlier contact this message is a near-copy of, and their similarity."""
+    candidate_ids = (
+        ContactFingerprint.objects.filter(bucket__in=contact_buckets, contact_id__lt=contact.pk)
+        .order_by('-contact_id').values_list('contact_id', flat=True).distinct()[:MAX_CANDIDATES]
+    )
+    best, best_similarity = None, 0.0
+    for candidate in Contact.objects.filter(pk__in=list(candidate_ids)).only('id', 'email', 'message'):
+        similarity = jaccard(shingle_set, shingles(candidate.message))
+        if similarity > best_similarity:
+            best, best_similarity = candidate, similarity
+    if best_similarity < DUPLICATE_SIMILARITY:
+        return None, best_similarity
+    return best, best_similarity
+
+
+def score_contact(contact):
+    """Return ``(score, reasons, duplicate_of, buckets)`` for a contact."""
+    message = contact.message or ''
+    weights, reasons = [], []
+
+    words = WORD_RE.findall(message)
+    links = len(URL_RE.findall(message))
+    if links:
+        weights.append(min(0.8, 0.25 * links))
+        reasons.append(f'links:{links}')
+        if links / max(len(words), 1) > 0.1:
+            weights.append(0.4)
+            reasons.append('link_density')
+
+    shingle_set = shingles(message)
+    contact_buckets = sorted(set(buckets(signature(shingle_set))))
+    duplicate, similarity = find_duplicate(contact, shingle_set, contact_buckets)
+    if duplicate is not None:
+        # The same text from different senders looks like a campaign
+        weights.append(0.7 if duplicate.email.lower() != contact.email.lower() else 0.4)
+        reasons.append(f'duplicate:{duplicate.pk}:{similarity:.2f}')
+
+    recent = Contact.objects.filter(
+        email=contact.email,
+        created_at__gte=contact.created_at - RATE_WINDOW,
+        created_at__lt=contact.created_at,
+    ).count()
+    if recent >= 2:
+        weights.append(min(0.8, 0.2 * recent))
+        reasons.append(f'rate:{recent}/24h')
+
+    letters = [char for char in message if char.isalpha()]
+    if len(letters) >= 20 and sum(char.isupper() for char in letters) / len(letters) > 0.6:
+        weights.append(0.3)
+        reasons.append('shouting')
+    if len(words) < 3:
+        weights.append(0.2)
+        reasons.append('short')
+
+    return combine(weights), reasons, duplicate, contact_buckets
+
+
+def score_contacts(ids):
+    """Score contacts and index their fingerprints, oldest first."""
+    contacts = Contact.objects.filter(pk__in=list(ids)).only('id', 'email', 'message', 'created_at').order_by('id')
+    scored = 0
+    for contact in contacts:
+        # Score first: the transaction only writes, so it never holds a lock while reading
+        score, reasons, duplicate, contact_buckets = score_contact(contact)
+        with transaction.atomic():
+            ContactFingerprint.objects.filter(contact=contact).delete()
+            ContactFingerprint.objects.bulk_create(
+                ContactFingerprint(contact=contact, bucket=bucket) for bucket in contact_buckets
+            )
+            scored += Contact.objects.filter(pk=contact.pk).update(
+                spam_score=score, spam_reasons=reasons, duplicate_of=duplicate,
+            )
+    if scored:
+        bump_revision(Contact)
+    return scored
+
+
+def run_job(ids):
+    try:
+        score_contacts(ids)
+    except Exception:
+        logger.exception('Spam scoring failed for contacts %s', ids)
+    finally:
+        if settings.SPAM_SCORING_ASYNC:
+            connections.close_all()
+
+
+def schedule(ids):
+    """Score contacts once the current transaction commits."""
+    ids = list(ids)
+    if not ids:
+        return
+
+    def enqueue():
+        if settings.SPAM_SCORING_ASYNC:
+            get_executor().submit(run_job, ids)
+        else:
+            run_job(ids)
+    transaction.on_commit(enqueue)
+
+
+def queue_new_contact(sender, instance, created, **kwargs):
+    """post_save: score contacts created one at a time."""
+    if created:
+        schedule([instance.pk])
@@ -0,0 +1,68 @@
+# backend/api/storage.py
+# Content-addressed media storage.
+#
+# Uploads are stored as <upload_to>/<sha256 of the content>.<ext>, so the
+# same bytes always get the same name and URL: re-uploading a logo or resume
+# reuses the stored file instead of writing a copy, and a URL never points
+# at different content, which makes it safe to serve with
+# "Cache-Control: immutable".
+#
+# Because rows may share a file, files are never deleted when a row stops
+# using them; the collect_media management command removes the ones nothing
+# references any more.
+
+import hashlib
+import posixpath
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+# Hex digits of the SHA-256 digest kept in file names (128 bits)
+DIGEST_LENGTH = 32
+HASHED_NAME_RE = re.compile(r'(^|/)[0-9a-f]{%d}(\.[A-Za-z0-9]+)?$' % DIGEST_LENGTH)
+
+
+class HashedFileExists(FileExistsError):
+    """The content-addressed name being saved is already stored."""
+
+
+def is_hashed_name(name):
+    """Whether a stored file name is content-addressed, i.e. its content never changes."""
+    return bool(HASHED_NAME_RE.search(name))
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """A FileSystemStorage that names files after the SHA-256 of their content."""
+    content_addressed = True
+
+    def hashed_name(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        if hasattr(content, 'seek') and content.seekable():
+            content.seek(0)
+        directory, basename = posixpath.split(name)
+        extension = posixpath.splitext(basename)[1].lower()
+        return posixpath.join(directory, digest.hexdigest()[:DIGEST_LENGTH] + extension)
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.hashed_name(name, content)
+        try:
+            return super().save(name, content, max_length=max_length)
+        except HashedFileExists:
+            # Same name, same bytes: nothing to write
+            return name
+
+    def get_available_name(self, name, max_length=None):
+        # Called before writing, and again when a concurrent save of the same
+        # bytes created the file first. Either way the existing file already
+        # has this content. Never pick a suffixed name: that copy wouldn't be
+        # content-addressed. Storage.save() validates the name itself.
+        if self.exists(name):
+            raise HashedFileExists(name)
+        return name
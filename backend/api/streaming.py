@@ -0,0 +1,61 @@
+# backend/api/streaming.py
+# Streaming JSON/NDJSON responses for the public lists.
+#
+# The regular list response serializes every row into one in-memory list.
+# With ?stream=ndjson (one object per line) or ?stream=json (a JSON array)
+# rows are read from a database iterator and serialized a chunk at a time,
+# so memory stays flat however large the table grows.
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+from .renderers import dumps
+
+STREAM_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+
+class StreamingListMixin:
+    """Serve ``list`` as a streamed response when ``?stream=`` is given."""
+    stream_query_param = 'stream'
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        stream_format = request.query_params.get(self.stream_query_param)
+        if not stream_format:
+            return super().list(request, *args, **kwargs)
+        if stream_format not in STREAM_CONTENT_TYPES:
+            raise ValidationError({
+                self.stream_query_param: f"Unknown stream format: {stream_format}",
+                'available_formats': list(STREAM_CONTENT_TYPES),
+            })
+        rows = self.iter_serialized(self.filter_queryset(self.get_queryset()))
+        if stream_format == 'ndjson':
+            content = (line + b'\n' for line in rows)
+        else:
+            content = self.iter_json_array(rows)
+        return StreamingHttpResponse(content, content_type=STREAM_CONTENT_TYPES[stream_format])
+
+    def iter_serialized(self, queryset):
+        """Yield each row as JSON bytes, serializing ``stream_chunk_size`` rows at a time."""
+        chunk = []
+        for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(instance)
+            if len(chunk) == self.stream_chunk_size:
+                yield from self.encode_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self.encode_chunk(chunk)
+
+    def encode_chunk(self, instances):
+        for item in self.get_serializer(instances, many=True).data:
+            yield dumps(item)
+
+    @staticmethod
+    def iter_json_array(rows):
+        yield b'['
+        for index, row in enumerate(rows):
+            yield row if index == 0 else b',' + row
+        yield b']'
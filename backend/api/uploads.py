@@ -0,0 +1,220 @@
+# backend/api/uploads.py
+# Resumable chunked uploads to file fields.
+#
+# A large PDF sent as one multipart request holds a worker for the whole
+# transfer and has to start over if the connection drops. Instead:
+#
+#   POST   <detail>/uploads/                  {field_name, filename, size, checksum}
+#   PATCH  <detail>/uploads/<id>/             raw bytes, Upload-Offset: <offset>
+#   GET    <detail>/uploads/<id>/             current offset, to resume after a failure
+#   POST   <detail>/uploads/<id>/commit/      attach the assembled file
+#   DELETE <detail>/uploads/<id>/             abandon the upload
+#
+# Each chunk is streamed from the request straight into a temporary file
+# under CHUNKED_UPLOAD_DIR and may carry an ``Upload-Checksum: sha256 <hex>``
+# header. On commit the file's SHA-256 is checked against the checksum given
+# when the upload started and the file is copied into storage a block at a
+# time, so the whole file is never held in memory.
+
+import fcntl
+import hashlib
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+
+from .models import ChunkedUpload
+from .serializers import ChunkedUploadSerializer
+
+UPLOAD_OFFSET_HEADER = 'Upload-Offset'
+UPLOAD_CHECKSUM_HEADER = 'Upload-Checksum'
+UPLOAD_ID_PATTERN = r'uploads/(?P<upload_id>[0-9a-f-]{36})'
+# Bytes read from the request or temporary file at a time
+BLOCK_SIZE = 64 * 1024
+
+
+def upload_path(upload):
+    return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{upload.pk}.part')
+
+
+def discard_upload(upload):
+    try:
+        os.remove(upload_path(upload))
+    except FileNotFoundError:
+        pass
+    upload.delete()
+
+
+def expire_uploads():
+    """Delete uploads that haven't received a chunk within CHUNKED_UPLOAD_EXPIRY seconds."""
+    cutoff = timezone.now() - timedelta(seconds=settings.CHUNKED_UPLOAD_EXPIRY)
+    for upload in ChunkedUpload.objects.filter(updated_at__lt=cutoff):
+        discard_upload(upload)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_checksum(value):
+    """Parse an ``Upload-Checksum: sha256 <hex>`` header into the hex digest."""
+    if not value:
+        return None
+    algorithm, _, digest = value.strip().partition(' ')
+    if algorithm.lower() != 'sha256' or len(digest.strip()) != 64:
+        raise ValidationError({UPLOAD_CHECKSUM_HEADER: 'Expected "sha256 <hex digest>".'})
+    return digest.strip().lower()
+
+
+class ChunkedUploadMixin:
+    """Add resumable chunked uploads to the file fields in ``chunked_upload_fields`` of a ModelViewSet."""
+    chunked_upload_fields = ()
+
+    def get_upload(self, instance, upload_id, lock=False):
+        uploads = ChunkedUpload.objects.select_for_update() if lock else ChunkedUpload.objects
+        try:
+            return uploads.get(pk=upload_id, target=instance._meta.label_lower, object_id=instance.pk)
+        except (ChunkedUpload.DoesNotExist, ValueError):
+            raise NotFound('Upload not found.')
+
+    @staticmethod
+    def upload_response(upload, status_code=status.HTTP_200_OK, error=None):
+        data = ChunkedUploadSerializer(upload).data
+        if error:
+            data = {'error': error, **data}
+        response = Response(data, status=status_code)
+        response[UPLOAD_OFFSET_HEADER] = str(upload.offset)
+        return response
+
+    @action(detail=True, methods=['post'], url_path='uploads')
+    def start_upload(self, request, pk=None):
+        instance = self.get_object()
+        expire_uploads()
+        serializer = ChunkedUploadSerializer(
+            data=request.data, context={'upload_fields': self.chunked_upload_fields},
+        )
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save(target=instance._meta.label_lower, object_id=instance.pk)
+        os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+        open(upload_path(upload), 'wb').close()
+        return self.upload_response(upload, status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get', 'patch', 'delete'], url_path=UPLOAD_ID_PATTERN)
+    def upload(self, request, pk=None, upload_id=None):
+        instance = self.get_object()
+        if request.method == 'GET':
+            return self.upload_response(self.get_upload(instance, upload_id))
+        if request.method == 'DELETE':
+            discard_upload(self.get_upload(instance, upload_id))
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return self.append_chunk(request, instance, upload_id)
+
+    def append_chunk(self, request, instance, upload_id):
+        try:
+            offset = int(request.headers[UPLOAD_OFFSET_HEADER])
+        except (KeyError, ValueError):
+            raise ValidationError({UPLOAD_OFFSET_HEADER: 'This header is required.'})
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            raise ValidationError({'Content-Length': 'Expected a number of bytes.'})
+        expected_checksum = parse_checksum(request.headers.get(UPLOAD_CHECKSUM_HEADER))
+
+        upload = self.get_upload(instance, upload_id)
+        if offset != upload.offset:
+            return self.offset_conflict(upload)
+        if offset + length > upload.size:
+            raise ValidationError({'error': f'Chunk would exceed the declared size of {upload.size} bytes.'})
+
+        # The chunk is read from the network outside any transaction, so a slow
+        # client never holds a database lock. A lock on the .part file keeps
+        # chunks of the same upload from being written at the same time.
+        try:
+            part = open(upload_path(upload), 'r+b')
+        except FileNotFoundError:
+            raise NotFound('Upload not found.')
+        with part:
+            try:
+                fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return self.upload_response(
+                    upload, status.HTTP_409_CONFLICT, 'Another chunk of this upload is being written.',
+                )
+            # A chunk may have finished between reading the offset and taking the lock
+            upload.refresh_from_db(fields=['offset'])
+            if offset != upload.offset:
+                return self.offset_conflict(upload)
+
+            digest = hashlib.sha256()
+            received = 0
+            # Drop whatever an interrupted chunk left past the offset
+            part.truncate(offset)
+            part.seek(offset)
+            stream = request.stream
+            while stream is not None and received < length:
+                block = stream.read(min(BLOCK_SIZE, length - received))
+                if not block:
+                    break
+                digest.update(block)
+                part.write(block)
+                received += len(block)
+            if received != length or (expected_checksum and digest.hexdigest() != expected_checksum):
+                part.truncate(offset)
+                raise ValidationError({'error': 'Chunk was incomplete or failed its checksum; resend it.'})
+            part.flush()
+
+            # Only advance from the offset this chunk was written at
+            updated = ChunkedUpload.objects.filter(pk=upload.pk, offset=offset).update(
+                offset=offset + received, updated_at=timezone.now(),
+            )
+        if not updated:
+            try:
+                upload.refresh_from_db()
+            except ChunkedUpload.DoesNotExist:
+                raise NotFound('Upload not found.')
+            return self.offset_conflict(upload)
+        upload.offset = offset + received
+        return self.upload_response(upload)
+
+    def offset_conflict(self, upload):
+        return self.upload_response(
+            upload, status.HTTP_409_CONFLICT, 'Offset does not match the bytes received so far.',
+        )
+
+    @action(detail=True, methods=['post'], url_path=f'{UPLOAD_ID_PATTERN}/commit')
+    def commit_upload(self, request, pk=None, upload_id=None):
+        instance = self.get_object()
+        with transaction.atomic():
+            upload = self.get_upload(instance, upload_id, lock=True)
+            if upload.offset != upload.size:
+                return self.upload_response(
+                    upload, status.HTTP_409_CONFLICT,
+                    f'Upload is incomplete: {upload.offset} of {upload.size} bytes received.',
+                )
+            path = upload_path(upload)
+            if upload.checksum and file_sha256(path) != upload.checksum:
+                discard_upload(upload)
+                return Response(
+                    {'error': 'The uploaded file does not match its checksum; upload it again.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            with open(path, 'rb') as assembled:
+                getattr(instance, upload.field_name).save(upload.filename, File(assembled), save=False)
+            update_fields = [upload.field_name]
+            if any(field.name == 'updated_at' for field in instance._meta.concrete_fields):
+                update_fields.append('updated_at')
+            instance.save(update_fields=update_fields)
+            discard_upload(upload)
+        return Response(self.get_serializer(instance).data)
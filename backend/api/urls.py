@@ -9,10 +9,12 @@ from .views import (
     EducationList,
     AboutList,
     ContactCreate,
+    contact_status,
     TestimonialList,
     SocialLinkList,
     SettingList,
     ServiceList,
+    PortfolioView,
     # Admin ViewSets for authenticated users
     ProjectAdminViewSet,
     SkillAdminViewSet,
@@ -32,6 +34,8 @@ from .views import (
     validate_invitation,
     get_current_admin_user,
     get_analytics_data,
+    get_analytics_timeseries,
+    get_cache_statistics,
     health_check
 )
 
@@ -64,10 +68,12 @@ public_urlpatterns = [
     path('educations/', EducationList.as_view(), name='education-list'),
     path('about/', AboutList.as_view(), name='about-list'),
     path('contacts/', ContactCreate.as_view(), name='contact-create'),
+    path('contacts/status/<uuid:ticket>/', contact_status, name='contact-status'),
     path('testimonials/', TestimonialList.as_view(), name='testimonial-list'),
     path('sociallinks/', SocialLinkList.as_view(), name='sociallink-list'),
     path('settings/', SettingList.as_view(), name='setting-list'),
     path('services/', ServiceList.as_view(), name='service-list'),
+    path('portfolio/', PortfolioView.as_view(), name='portfolio'),
 ]
 
 # Combine the public URLs with the admin URLs generated by the router.
@@ -78,5 +84,7 @@ urlpatterns = [
     path('validate-invitation/', validate_invitation, name='validate_invitation'),
     path('current-admin-user/', get_current_admin_user, name='current_admin_user'),
     path('analytics/', get_analytics_data, name='analytics_data'),
+    path('analytics/timeseries/', get_analytics_timeseries, name='analytics_timeseries'),
+    path('cache-stats/', get_cache_statistics, name='cache_stats'),
     path('health/', health_check, name='health_check'),
 ] + public_urlpatterns
@@ -1,17 +1,34 @@
+from django.conf import settings
+from django.db import transaction
 from django.shortcuts import render
 from rest_framework import generics
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework import viewsets
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from django.utils import timezone   
+from django.utils.dateparse import parse_date, parse_datetime
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 # from django.http import JsonResponse
 from .models import Project, About
 from .serializers import ProjectSerializer, AboutSerializer
+from teniola_site.firebase_authentication import token_cache
+from .permissions import RequiresPermission
+from .analytics import TIMESERIES_METRICS, get_dashboard_counts, get_timeseries
+from .cache import CachedListMixin, ConditionalGetMixin, cached_data, get_cache_stats
+from .fieldsets import SparseFieldsetsMixin
+from .idempotency import IdempotentCreateMixin, idempotent
+from .pagination import KeysetPagination, PublicListPagination
+from .ratelimit import body_field, query_param, rate_limit
+from .spam import SPAM_THRESHOLD
+from .streaming import StreamingListMixin
+from .uploads import ChunkedUploadMixin
+from . import ingest, outbox
 from django.views.decorators.csrf import csrf_exempt # <-- New import
 from django.utils.decorators import method_decorator # <-- New import
 from rest_framework.decorators import api_view, permission_classes # <-- New import
 from rest_framework import status # <-- New import
 from rest_framework.response import Response # <-- New import
+from rest_framework.reverse import reverse
 from .models import (
     Project,
     Skill,
@@ -34,6 +51,7 @@ from .serializers import (
     AboutSerializer,
     EducationSerializer,
     ContactSerializer,
+    PublicContactSerializer,
     TestimonialSerializer,
     SocialLinkSerializer,
     SettingSerializer,
@@ -42,99 +60,136 @@ from .serializers import (
     AdminUserSerializer,
     AdminInvitationSerializer,
     AcceptInvitationSerializer,
-    CreateInvitationSerializer
+    CreateInvitationSerializer,
+    # Read-only serializers for the public lists
+    ProjectReadSerializer,
+    SkillReadSerializer,
+    ExperienceReadSerializer,
+    EducationReadSerializer,
+    AboutReadSerializer,
+    TestimonialReadSerializer,
+    SocialLinkReadSerializer,
+    SettingReadSerializer,
+    ServiceReadSerializer,
 )
 
 # Create your views here.
 
-class ProjectAdminViewSet(viewsets.ModelViewSet):
+# Default and maximum spans of a /analytics/timeseries/ request
+TIMESERIES_DEFAULT_RANGE = {'day': timedelta(days=30), 'hour': timedelta(days=2)}
+TIMESERIES_MAX_RANGE = {'day': timedelta(days=366 * 5), 'hour': timedelta(days=31)}
+
+class ProjectAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all().order_by('-created_at')
     serializer_class = ProjectSerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_projects', 'view_projects')]
 
-class SkillAdminViewSet(viewsets.ModelViewSet):
+class SkillAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Skill.objects.all().order_by('-created_at')
     serializer_class = SkillSerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_skills', 'view_skills')]
 
-class TestimonialAdminViewSet(viewsets.ModelViewSet):
+class TestimonialAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Testimonial.objects.all().order_by('-created_at')
     serializer_class = TestimonialSerializer
-    permission_classes = [IsAuthenticated]
-class ExperienceAdminViewSet(viewsets.ModelViewSet):
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_testimonials', 'view_testimonials')]
+class ExperienceAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Experience.objects.all().order_by('-created_at')
     serializer_class = ExperienceSerializer
-    permission_classes = [IsAuthenticated]
-class EducationAdminViewSet(viewsets.ModelViewSet):
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_experience', 'view_experience')]
+class EducationAdminViewSet(IdempotentCreateMixin, ChunkedUploadMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Education.objects.all().order_by('-created_at')
     serializer_class = EducationSerializer
-    permission_classes = [IsAuthenticated]
-class AboutAdminViewSet(viewsets.ModelViewSet):
+    chunked_upload_fields = ('certificate',)
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_education', 'view_education')]
+class AboutAdminViewSet(IdempotentCreateMixin, ChunkedUploadMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = About.objects.all()
     serializer_class = AboutSerializer
-    permission_classes = [IsAuthenticated]
-class ContactAdminViewSet(viewsets.ModelViewSet):
+    chunked_upload_fields = ('resume',)
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_about', 'view_about')]
+class ContactAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Contact.objects.all().order_by('-created_at')
     serializer_class = ContactSerializer
-    permission_classes = [IsAuthenticated]
-class SocialLinkAdminViewSet(viewsets.ModelViewSet):
+    pagination_class = KeysetPagination
+    permission_classes = [IsAuthenticated, RequiresPermission()]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Optional ?spam=false, or ?min_spam_score=/?max_spam_score=; scores have their own index
+        params = self.request.query_params
+        spam = params.get('spam')
+        if spam is not None:
+            if spam not in ('true', 'false'):
+                raise ValidationError({'spam': 'Expected true or false.'})
+            if spam == 'true':
+                queryset = queryset.filter(spam_score__gte=SPAM_THRESHOLD)
+            else:
+                queryset = queryset.filter(spam_score__lt=SPAM_THRESHOLD)
+        for param, lookup in (('min_spam_score', 'spam_score__gte'), ('max_spam_score', 'spam_score__lte')):
+            if params.get(param) is not None:
+                try:
+                    queryset = queryset.filter(**{lookup: float(params[param])})
+                except ValueError:
+                    raise ValidationError({param: 'Expected a number between 0 and 1.'})
+        return queryset
+class SocialLinkAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = SocialLink.objects.all().order_by('-created_at')
     serializer_class = SocialLinkSerializer
-    permission_classes = [IsAuthenticated]
-class SettingAdminViewSet(viewsets.ModelViewSet):
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_settings')]
+class SettingAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Setting.objects.all()
     serializer_class = SettingSerializer
-    permission_classes = [IsAuthenticated]
-class ServiceAdminViewSet(viewsets.ModelViewSet):
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_settings')]
+class ServiceAdminViewSet(IdempotentCreateMixin, ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Service.objects.all().order_by('-created_at')
     serializer_class = ServiceSerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, RequiresPermission('manage_services', 'view_services')]
 
 
 
 # --- Core Portfolio Views (Read-only for public access) ---
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class ProjectList(generics.ListAPIView):
+class ProjectList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Project.objects.all().order_by('-created_at')
-    serializer_class = ProjectSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = ProjectReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 # --- Portfolio Views ---
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class SkillList(generics.ListAPIView):
+class SkillList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Skill.objects.all().order_by('-created_at')
-    serializer_class = SkillSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = SkillReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 @method_decorator(csrf_exempt, name='dispatch')
-class ExperienceList(generics.ListAPIView):
+class ExperienceList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Experience.objects.all().order_by('-created_at')
-    serializer_class = ExperienceSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = ExperienceReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class EducationList(generics.ListAPIView):
+class EducationList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Education.objects.all().order_by('-created_at')
-    serializer_class = EducationSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = EducationReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class AboutList(generics.ListAPIView):
+class AboutList(ConditionalGetMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = About.objects.all()
-    serializer_class = AboutSerializer
+    serializer_class = AboutReadSerializer
     pagination_class = None  # Disable pagination for public API
 
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class SocialLinkList(generics.ListAPIView):
+class SocialLinkList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = SocialLink.objects.all().order_by('-created_at')
-    serializer_class = SocialLinkSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = SocialLinkReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 
 # --- Communication Views ---
@@ -145,12 +200,16 @@ class SocialLinkList(generics.ListAPIView):
 #     serializer_class = ContactSerializer
 
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
+@method_decorator(rate_limit('contact', key=body_field('email')), name='dispatch')
 class ContactCreate(generics.CreateAPIView):
     permission_classes = [AllowAny]
     queryset = Contact.objects.all()
-    serializer_class = ContactSerializer
+    serializer_class = PublicContactSerializer
 
+    @idempotent
     def create(self, request, *args, **kwargs):
+        if settings.CONTACT_QUEUE_ENABLED:
+            return self.enqueue(request)
         try:
             return super().create(request, *args, **kwargs)
         except Exception as e:
@@ -159,28 +218,123 @@ class ContactCreate(generics.CreateAPIView):
             traceback.print_exc()
             return Response({'detail': str(e)}, status=500)
 
+    def perform_create(self, serializer):
+        # The notification is queued in the same transaction (see api/outbox.py)
+        with transaction.atomic():
+            contact = serializer.save()
+            outbox.contact_received([contact])
+
+    def enqueue(self, request):
+        """Validate the submission and queue it for storage (see api/ingest.py)."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            ticket = ingest.enqueue(serializer.validated_data)
+        except ingest.QueueFull:
+            return Response(
+                {'detail': 'Too many messages are waiting to be stored; please try again shortly.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(settings.CONTACT_QUEUE_POLL_INTERVAL)},
+            )
+        return Response(
+            {
+                'message': 'Your message has been received.',
+                'ticket': ticket,
+                'status': ingest.QUEUED,
+                'status_url': reverse('contact-status', kwargs={'ticket': ticket}, request=request),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def contact_status(request, ticket):
+    """Whether a queued contact submission has been stored yet"""
+    submission = ingest.submission_status(ticket)
+    if submission is None:
+        return Response({'error': 'Submission not found.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(submission)
+
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class TestimonialList(generics.ListAPIView):
+class TestimonialList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Testimonial.objects.all().order_by('-created_at')
-    serializer_class = TestimonialSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = TestimonialReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
 
 
 # --- Configuration Views ---
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class SettingList(generics.ListAPIView):
+class SettingList(ConditionalGetMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Setting.objects.all()
-    serializer_class = SettingSerializer
+    serializer_class = SettingReadSerializer
     pagination_class = None  # Disable pagination for public API
 
 @method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
-class ServiceList(generics.ListAPIView):
+class ServiceList(ConditionalGetMixin, StreamingListMixin, CachedListMixin, SparseFieldsetsMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     queryset = Service.objects.all().order_by('-created_at')
-    serializer_class = ServiceSerializer
-    pagination_class = None  # Disable pagination for public API
+    serializer_class = ServiceReadSerializer
+    pagination_class = PublicListPagination  # Unpaginated unless ?limit= or ?cursor= is given
+
+# --- Aggregated Portfolio View ---
+# Maps each section of the public site to the list view that already serves it,
+# so the composite endpoint reuses the same querysets and serializers.
+PUBLIC_SECTIONS = {
+    'about': AboutList,
+    'projects': ProjectList,
+    'skills': SkillList,
+    'testimonials': TestimonialList,
+    'services': ServiceList,
+    'experiences': ExperienceList,
+    'educations': EducationList,
+    'sociallinks': SocialLinkList,
+    'settings': SettingList,
+}
+
+@method_decorator(csrf_exempt, name='dispatch')  # <-- Apply CSRF exemption
+class PortfolioView(ConditionalGetMixin, generics.GenericAPIView):
+    """Return every public section in a single response.
+
+    Use ``?sections=projects,skills`` to limit the response to a subset.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []  # Public data, skip token verification
+    pagination_class = None
+
+    def get_sections(self, request):
+        requested = request.query_params.get('sections')
+        if not requested:
+            return list(PUBLIC_SECTIONS)
+        sections = [name.strip() for name in requested.split(',') if name.strip()]
+        unknown = [name for name in sections if name not in PUBLIC_SECTIONS]
+        if unknown:
+            raise ValidationError({
+                'error': f"Unknown section(s): {', '.join(unknown)}",
+                'available_sections': list(PUBLIC_SECTIONS),
+            })
+        return sections
+
+    def get_conditional_models(self):
+        return [PUBLIC_SECTIONS[name].queryset.model for name in self.get_sections(self.request)]
+
+    def get(self, request, *args, **kwargs):
+        return self.conditional_response(request, self.get_portfolio)
+
+    def get_portfolio(self, request):
+        data = {}
+        context = self.get_serializer_context()
+        for name in self.get_sections(request):
+            view_class = PUBLIC_SECTIONS[name]
+            # Shares cache entries with the standalone list view for the section
+            data[name], _ = cached_data(
+                view_class.__name__,
+                [view_class.queryset.model],
+                request,
+                lambda: list(view_class.serializer_class(view_class.queryset.all(), many=True, context=context).data),
+            )
+        return Response(data)
 
 # --- Admin Management Views ---
 class AdminRoleViewSet(viewsets.ReadOnlyModelViewSet):
@@ -196,7 +350,7 @@ class AdminRoleViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Get the current admin user
         try:
-            admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
+            admin_user = self.request.user.get_admin_user()
             # Superadmins and admins can see all roles
             if admin_user.role.name in ['superadmin', 'admin']:
                 return AdminRole.objects.all()
@@ -209,6 +363,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
     queryset = AdminUser.objects.all()
     serializer_class = AdminUserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         # Get the Firebase UID from the FirebaseUser object
@@ -218,7 +373,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         
         # Get the current admin user
         try:
-            admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
+            admin_user = self.request.user.get_admin_user()
             # Superadmins can see all users, regular admins only see themselves
             if admin_user.role.name == 'superadmin':
                 return AdminUser.objects.all().select_related('role').order_by('-created_at')
@@ -234,7 +389,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Authentication required")
         
         try:
-            current_admin = AdminUser.objects.get(firebase_uid=firebase_uid)
+            current_admin = self.request.user.get_admin_user()
             # Only superadmins can delete users
             if current_admin.role.name != 'superadmin':
                 raise PermissionDenied("Only superadmins can delete users")
@@ -258,7 +413,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Authentication required")
         
         try:
-            current_admin = AdminUser.objects.get(firebase_uid=firebase_uid)
+            current_admin = self.request.user.get_admin_user()
             instance = serializer.instance
             
             # Only superadmins can modify other users
@@ -274,9 +429,10 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         except AdminUser.DoesNotExist:
             raise PermissionDenied("Admin user not found")
 
-class AdminInvitationViewSet(viewsets.ModelViewSet):
+class AdminInvitationViewSet(IdempotentCreateMixin, viewsets.ModelViewSet):
     queryset = AdminInvitation.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -291,15 +447,23 @@ class AdminInvitationViewSet(viewsets.ModelViewSet):
         
         # Get the current admin user
         try:
-            admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
+            admin_user = self.request.user.get_admin_user()
             # Superadmins can see all invitations, regular admins only see their own
             if admin_user.role.name == 'superadmin':
-                return AdminInvitation.objects.all().select_related('role', 'invited_by').order_by('-created_at')
+                queryset = AdminInvitation.objects.all()
             else:
-                return AdminInvitation.objects.filter(invited_by__firebase_uid=firebase_uid).select_related('role', 'invited_by').order_by('-created_at')
+                queryset = AdminInvitation.objects.filter(invited_by=admin_user)
         except AdminUser.DoesNotExist:
             return AdminInvitation.objects.none()
-    
+
+        # Optional ?status=pending etc.; pending invitations have their own index
+        invitation_status = self.request.query_params.get('status')
+        if invitation_status:
+            if invitation_status not in dict(AdminInvitation.STATUS_CHOICES):
+                raise ValidationError({'status': f'Unknown status: {invitation_status}'})
+            queryset = queryset.filter(status=invitation_status)
+        return queryset.select_related('role', 'invited_by__role').order_by('-created_at', '-id')
+
     def perform_create(self, serializer):
         import secrets
         import string
@@ -324,16 +488,20 @@ class AdminInvitationViewSet(viewsets.ModelViewSet):
         
         # Get or create the AdminUser for the current user
         try:
-            admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
+            admin_user = self.request.user.get_admin_user()
         except AdminUser.DoesNotExist:
             raise ValueError('Current user is not an admin user.')
         
-        serializer.save(
-            invite_code=generate_invite_code(),
-            invited_by=admin_user,
-            expires_at=expires_at
-        )
+        # The invitation email is queued in the same transaction (see api/outbox.py)
+        with transaction.atomic():
+            invitation = serializer.save(
+                invite_code=generate_invite_code(),
+                invited_by=admin_user,
+                expires_at=expires_at
+            )
+            outbox.invitation_created(invitation)
 
+@rate_limit('accept-invitation', key=body_field('invite_code'))
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def accept_invitation(request):
@@ -379,6 +547,7 @@ def accept_invitation(request):
     
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@rate_limit('validate-invitation', key=query_param('code'))
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def validate_invitation(request):
@@ -429,21 +598,18 @@ def get_analytics_data(request):
             )
         
         # Verify user is admin
-        admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
-        
-        # Calculate analytics data
-        total_projects = Project.objects.count()
-        total_skills = Skill.objects.count()
-        total_experiences = Experience.objects.count()
-        total_contacts = Contact.objects.count()
-        total_testimonials = Testimonial.objects.count()
-        
-        # Recent activity (last 30 days)
-        from datetime import datetime, timedelta
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+        admin_user = request.user.get_admin_user()
         
-        recent_contacts = Contact.objects.filter(created_at__gte=thirty_days_ago).count()
-        recent_projects = Project.objects.filter(created_at__gte=thirty_days_ago).count()
+        # Counts come from the maintained counters table; ?refresh=1 recomputes them
+        refresh = request.query_params.get('refresh') in ('1', 'true')
+        totals, recent = get_dashboard_counts(refresh=refresh)
+        total_projects = totals['projects']
+        total_skills = totals['skills']
+        total_experiences = totals['experiences']
+        total_contacts = totals['contacts']
+        total_testimonials = totals['testimonials']
+        recent_contacts = recent['contacts']
+        recent_projects = recent['projects']
         
         analytics_data = {
             'overview': {
@@ -471,6 +637,76 @@ def get_analytics_data(request):
             status=status.HTTP_404_NOT_FOUND
         )
 
+def parse_timeseries_bound(value, default):
+    """Parse a ?from=/?to= value given as an ISO date or datetime (UTC if naive)"""
+    if not value:
+        return default
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f'Invalid date: {value}')
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_analytics_timeseries(request):
+    """Get a metric's hourly or daily counts from the analytics rollups"""
+    try:
+        # Verify user is admin
+        request.user.get_admin_user()
+    except AdminUser.DoesNotExist:
+        return Response(
+            {'error': 'Admin user not found.'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    metric = request.query_params.get('metric')
+    granularity = request.query_params.get('granularity', 'day')
+    if metric not in TIMESERIES_METRICS:
+        return Response(
+            {'error': 'Unknown metric.', 'available_metrics': TIMESERIES_METRICS},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if granularity not in TIMESERIES_MAX_RANGE:
+        return Response(
+            {'error': f"Granularity must be one of: {', '.join(TIMESERIES_MAX_RANGE)}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    max_range = TIMESERIES_MAX_RANGE[granularity]
+    try:
+        end = parse_timeseries_bound(request.query_params.get('to'), timezone.now())
+        start = parse_timeseries_bound(request.query_params.get('from'), end - TIMESERIES_DEFAULT_RANGE[granularity])
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    if start >= end or end - start > max_range:
+        return Response(
+            {'error': f'"from" must be before "to" and at most {max_range.days} days earlier.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    points = get_timeseries(metric, granularity, start, end)
+    return Response({
+        'metric': metric,
+        'granularity': granularity,
+        'from': start,
+        'to': end,
+        'points': [{'bucket': bucket, 'value': value} for bucket, value in points],
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_cache_statistics(request):
+    """Get hit rate and fill time of the public API cache and the token cache"""
+    return Response({
+        'responses': get_cache_stats(),
+        'firebase_tokens': token_cache.stats(),
+    })
+
 @api_view(['GET', 'PATCH'])
 @permission_classes([IsAuthenticated])
 def get_current_admin_user(request):
@@ -495,7 +731,7 @@ def get_current_admin_user(request):
         print(f"DEBUG: Looking for AdminUser with firebase_uid: {firebase_uid}")
         
         try:
-            admin_user = AdminUser.objects.get(firebase_uid=firebase_uid)
+            admin_user = request.user.get_admin_user()
             print(f"DEBUG: Found existing admin user: {admin_user}")
         except AdminUser.DoesNotExist:
             print(f"DEBUG: AdminUser not found, creating new one for firebase_uid: {firebase_uid}")
@@ -2,6 +2,13 @@
 # This file defines a custom authentication class for Django REST Framework
 # that uses Firebase ID tokens to authenticate users.
 
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
 import firebase_admin
 from firebase_admin import auth, credentials
 from rest_framework.authentication import BaseAuthentication
@@ -9,13 +16,20 @@ from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth.models import AnonymousUser
 from django.conf import settings
 
+from .firebase_certs import CertificateStore, OfflineCredential, install_certificate_store
+
 
 # Initialize Firebase Admin SDK
 # We do this once to avoid re-initializing it on every request.
 # The service account key path must be defined in settings.py.
 if not firebase_admin._apps:
+    # Offline mode: tokens are signed by a local key set, so no service
+    # account is needed as long as the project ID is configured.
+    if getattr(settings, 'FIREBASE_LOCAL_CERTS_PATH', None) and not os.path.exists(
+            getattr(settings, 'FIREBASE_SERVICE_ACCOUNT_KEY_PATH', '')):
+        firebase_admin.initialize_app(OfflineCredential(), {'projectId': settings.FIREBASE_PROJECT_ID})
     # This checks if the setting exists before trying to use it.
-    if hasattr(settings, 'FIREBASE_SERVICE_ACCOUNT_KEY_PATH'):
+    elif hasattr(settings, 'FIREBASE_SERVICE_ACCOUNT_KEY_PATH'):
         try:
             cred = credentials.Certificate(settings.FIREBASE_SERVICE_ACCOUNT_KEY_PATH)
             firebase_admin.initialize_app(cred)
@@ -29,6 +43,25 @@ if not firebase_admin._apps:
         raise AuthenticationFailed("FIREBASE_SERVICE_ACCOUNT_KEY_PATH not defined in settings.py")
 
 
+def _build_certificate_store():
+    local_certs = None
+    local_certs_path = getattr(settings, 'FIREBASE_LOCAL_CERTS_PATH', None)
+    if local_certs_path:
+        with open(local_certs_path) as certs_file:
+            local_certs = json.load(certs_file)
+    return CertificateStore(
+        cache_path=getattr(settings, 'FIREBASE_CERTS_CACHE_PATH', None),
+        refresh_margin=getattr(settings, 'FIREBASE_CERTS_REFRESH_MARGIN', 300),
+        local_certs=local_certs,
+    )
+
+
+# Serve Google's signing certificates from a file-backed cache (or a local
+# key set) instead of fetching them over HTTP during verification.
+certificate_store = _build_certificate_store()
+install_certificate_store(certificate_store)
+
+
 class FirebaseUser:
     """
     A custom user class that mimics Django's User model interface
@@ -41,10 +74,109 @@ class FirebaseUser:
         self.is_authenticated = True
         self.is_anonymous = False
         self.pk = uid  # Use UID as primary key
+        self._admin_user = None
+        self._admin_user_resolved = False
     
     def __str__(self):
         return self.email or self.uid
 
+    def get_admin_user(self):
+        """
+        Returns the AdminUser (with its role) for this Firebase user.
+        It is looked up once per request and shared across requests through
+        the cache. Raises AdminUser.DoesNotExist if the user is not an admin.
+        """
+        from api.cache import get_cached_admin_user
+        from api.models import AdminUser
+
+        if not self._admin_user_resolved:
+            self._admin_user = get_cached_admin_user(self.uid)
+            self._admin_user_resolved = True
+        if self._admin_user is None:
+            raise AdminUser.DoesNotExist(f'No admin user with Firebase UID {self.uid}')
+        return self._admin_user
+
+
+class TokenCache:
+    """
+    A bounded, thread-safe LRU cache of verified Firebase ID tokens.
+
+    Verified tokens are kept until their own 'exp' claim, so repeated requests
+    with the same token skip signature verification. Rejected tokens are kept
+    for a short time so a client retrying a bad token doesn't cost a
+    verification each time. Tokens are stored under their SHA-256 hash.
+    """
+    def __init__(self, maxsize=1024, negative_ttl=30):
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(id_token):
+        return hashlib.sha256(id_token.encode()).hexdigest()
+
+    def get(self, id_token):
+        """Return (decoded_token, error) for a cached token, or None on a miss."""
+        key = self._key(id_token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry[2] is not None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return entry[1], entry[2]
+
+    def _store(self, id_token, expires_at, decoded_token, error):
+        key = self._key(id_token)
+        with self._lock:
+            self._entries[key] = (expires_at, decoded_token, error)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def set_valid(self, id_token, decoded_token):
+        expires_at = decoded_token.get('exp')
+        if expires_at and expires_at > time.time():
+            self._store(id_token, expires_at, decoded_token, None)
+
+    def set_invalid(self, id_token, error):
+        self._store(id_token, time.time() + self.negative_ttl, None, error)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.negative_hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.negative_hits) / lookups, 4) if lookups else None,
+            }
+
+
+# Shared by every request handled by this worker process.
+token_cache = TokenCache(
+    maxsize=getattr(settings, 'FIREBASE_TOKEN_CACHE_SIZE', 1024),
+    negative_ttl=getattr(settings, 'FIREBASE_TOKEN_NEGATIVE_TTL', 30),
+)
+
 
 class FirebaseAuthentication(BaseAuthentication):
     """
@@ -79,7 +211,33 @@ class FirebaseAuthentication(BaseAuthentication):
             print("DEBUG: Failed to split authorization header")
             return None
 
-        # Verify the Firebase ID token and get the user's data.
+        # Serve previously verified (or rejected) tokens from the cache.
+        cached = token_cache.get(id_token)
+        if cached is not None:
+            decoded_token, error = cached
+            if error is not None:
+                raise AuthenticationFailed(f'Invalid Firebase ID token: {error}')
+        else:
+            decoded_token = self.verify_token(id_token)
+            token_cache.set_valid(id_token, decoded_token)
+
+        uid = decoded_token['uid']
+        email = decoded_token.get('email')
+        display_name = decoded_token.get('name', '')
+
+        print(f"DEBUG: Token verified successfully. UID: {uid}, Email: {email}")
+
+        # Create a FirebaseUser object that mimics Django's User interface
+        user = FirebaseUser(uid=uid, email=email, display_name=display_name)
+        
+        # Return the user object and the decoded token
+        return (user, decoded_token)
+
+    def verify_token(self, id_token):
+        """
+        Verifies the Firebase ID token and returns the decoded claims.
+        Raises AuthenticationFailed if the token is invalid.
+        """
         try:
             print("DEBUG: Attempting to verify Firebase ID token...")
             decoded_token = auth.verify_id_token(id_token, check_revoked=False)
@@ -88,7 +246,6 @@ class FirebaseAuthentication(BaseAuthentication):
             message = str(e)
             print(f"DEBUG: Firebase token verification failed: {message}")
             if 'Token used too early' in message:
-                import time
                 print("DEBUG: Detected 'Token used too early'. Retrying verification after 2 seconds...")
                 time.sleep(2)
                 try:
@@ -98,16 +255,6 @@ class FirebaseAuthentication(BaseAuthentication):
                     raise AuthenticationFailed(f'Invalid Firebase ID token: {str(e2)}')
             else:
                 # Propagate other verification errors
+                token_cache.set_invalid(id_token, message)
                 raise AuthenticationFailed(f'Invalid Firebase ID token: {message}')
-
-        uid = decoded_token['uid']
-        email = decoded_token.get('email')
-        display_name = decoded_token.get('name', '')
-
-        print(f"DEBUG: Token verified successfully. UID: {uid}, Email: {email}")
-
-        # Create a FirebaseUser object that mimics Django's User interface
-        user = FirebaseUser(uid=uid, email=email, display_name=display_name)
-        
-        # Return the user object and the decoded token
-        return (user, decoded_token)
+        return decoded_token
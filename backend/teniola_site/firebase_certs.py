@@ -0,0 +1,260 @@
+# teniola_site/firebase_certs.py
+# Keeps the public certificates Firebase ID tokens are signed with in a
+# file-backed cache so token verification never waits on Google's servers.
+#
+# firebase_admin fetches the certificates through a google-auth transport.
+# CachedCertsRequest wraps that transport and answers requests for the
+# certificate URL from a CertificateStore, which:
+#   - persists the certificates to disk, so new workers start warm,
+#   - honors the Cache-Control max-age Google sends with them,
+#   - refreshes them in a background thread before they expire,
+#   - can be pinned to a local key set (see LocalIssuer) for offline use.
+
+import datetime
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from firebase_admin import auth, credentials
+from google.auth import crypt, exceptions, jwt, transport
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport import requests as google_requests
+
+logger = logging.getLogger(__name__)
+
+# Where Firebase publishes the x509 certificates used to sign ID tokens.
+ID_TOKEN_CERT_URL = 'https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com'
+ID_TOKEN_ISSUER_PREFIX = 'https://securetoken.google.com/'
+
+DEFAULT_MAX_AGE = 60 * 60  # Used when the response has no usable max-age
+RETRY_INTERVAL = 60
+
+
+def parse_max_age(headers):
+    """Return the freshness lifetime in seconds from Cache-Control/Age headers."""
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    match = re.search(r'max-age=(\d+)', headers.get('cache-control', ''))
+    if not match:
+        return DEFAULT_MAX_AGE
+    try:
+        age = int(headers.get('age', 0))
+    except ValueError:
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class CertificateStore:
+    """
+    A file-backed cache of signing certificates.
+
+    Passing ``local_certs`` pins the store to that key set: it is never
+    refreshed and no network request is made.
+    """
+    def __init__(self, cert_url=ID_TOKEN_CERT_URL, cache_path=None, refresh_margin=300,
+                 local_certs=None, transport_request=None):
+        self.cert_url = cert_url
+        self.cache_path = cache_path or os.path.join(tempfile.gettempdir(), 'firebase_certs.json')
+        self.refresh_margin = refresh_margin
+        self.local_certs = local_certs
+        self._transport_request = transport_request
+        self._certs = local_certs
+        self._expires_at = float('inf') if local_certs is not None else 0
+        self._lock = threading.Lock()
+        self._refresh_pid = None
+
+    @property
+    def transport_request(self):
+        if self._transport_request is None:
+            self._transport_request = google_requests.Request()
+        return self._transport_request
+
+    def get(self):
+        """Return the current certificates as a ``{key id: certificate}`` mapping."""
+        if self.local_certs is not None:
+            return self.local_certs
+        self._ensure_refresh_thread()
+        if self._certs is not None and time.time() < self._expires_at:
+            return self._certs
+        with self._lock:
+            # Another thread may have refreshed the certificates while we waited.
+            if self._certs is not None and time.time() < self._expires_at:
+                return self._certs
+            if self._load():
+                return self._certs
+            return self._refresh_locked()
+
+    def refresh(self):
+        """Fetch the certificates from the network and persist them."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self):
+        try:
+            response = self.transport_request(self.cert_url, method='GET')
+            if response.status != 200:
+                raise exceptions.TransportError(
+                    f'Could not fetch certificates at {self.cert_url} (HTTP {response.status})')
+            certs = json.loads(response.data.decode('utf-8'))
+        except Exception:
+            if self._certs is not None:
+                # Google rotates keys with a long overlap, so stale keys are a
+                # far better answer than failing every admin request.
+                logger.warning('Failed to refresh Firebase certificates, using cached copy', exc_info=True)
+                self._expires_at = time.time() + RETRY_INTERVAL
+                return self._certs
+            raise
+        self._certs = certs
+        self._expires_at = time.time() + parse_max_age(response.headers)
+        self._save()
+        return certs
+
+    def _load(self):
+        try:
+            with open(self.cache_path) as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return False
+        if cached.get('url') != self.cert_url or cached.get('expires_at', 0) <= time.time():
+            return False
+        self._certs = cached['certs']
+        self._expires_at = cached['expires_at']
+        return True
+
+    def _save(self):
+        # Write to a temporary file and rename so other workers never read a partial file.
+        directory = os.path.dirname(self.cache_path) or '.'
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.firebase_certs')
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump({'url': self.cert_url, 'expires_at': self._expires_at, 'certs': self._certs}, tmp_file)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            logger.warning('Could not persist Firebase certificates to %s', self.cache_path, exc_info=True)
+
+    def _ensure_refresh_thread(self):
+        # Threads don't survive a fork, so start one per worker process.
+        if self._refresh_pid == os.getpid():
+            return
+        self._refresh_pid = os.getpid()
+        thread = threading.Thread(target=self._refresh_loop, name='firebase-cert-refresh', daemon=True)
+        thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            delay = self._expires_at - self.refresh_margin - time.time()
+            if delay > 0:
+                time.sleep(min(delay, DEFAULT_MAX_AGE))
+                continue
+            try:
+                with self._lock:
+                    # Another worker may already have refreshed the file.
+                    if not self._load() or self._expires_at - self.refresh_margin <= time.time():
+                        self._refresh_locked()
+            except Exception:
+                logger.warning('Background refresh of Firebase certificates failed', exc_info=True)
+            if self._expires_at - self.refresh_margin <= time.time():
+                time.sleep(RETRY_INTERVAL)
+
+
+class _CertsResponse(transport.Response):
+    def __init__(self, certs):
+        self._data = json.dumps(certs).encode('utf-8')
+
+    @property
+    def status(self):
+        return 200
+
+    @property
+    def headers(self):
+        return {'content-type': 'application/json'}
+
+    @property
+    def data(self):
+        return self._data
+
+
+class CachedCertsRequest(transport.Request):
+    """A google-auth transport that serves the certificate URL from a CertificateStore."""
+    def __init__(self, store, fallback):
+        self.store = store
+        self.fallback = fallback
+
+    def __call__(self, url, method='GET', body=None, headers=None, timeout=None, **kwargs):
+        if method == 'GET' and url == self.store.cert_url:
+            return _CertsResponse(self.store.get())
+        return self.fallback(url, method=method, body=body, headers=headers, timeout=timeout, **kwargs)
+
+
+def install_certificate_store(store, app=None):
+    """Route certificate lookups of ``auth.verify_id_token`` through ``store``."""
+    verifier = auth._get_client(app)._token_verifier
+    fallback = verifier.request
+    if isinstance(fallback, CachedCertsRequest):
+        fallback = fallback.fallback
+    verifier.request = CachedCertsRequest(store, fallback)
+    return verifier.request
+
+
+class OfflineCredential(credentials.Base):
+    """
+    A credential for verifying tokens against a local key set without a
+    service account. Calls to other Firebase APIs will fail to authorize.
+    """
+    def get_credential(self):
+        return AnonymousCredentials()
+
+
+class LocalIssuer:
+    """
+    A local stand-in for Firebase Authentication that signs ID tokens with
+    its own RSA key, for exercising and benchmarking the auth path offline.
+    """
+    def __init__(self, project_id, key_id='local-key'):
+        self.project_id = project_id
+        self.key_id = key_id
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'local-firebase-issuer')])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(private_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=365))
+            .sign(private_key, hashes.SHA256())
+        )
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        self.certs = {key_id: certificate.public_bytes(serialization.Encoding.PEM).decode('utf-8')}
+        self._signer = crypt.RSASigner.from_string(private_pem, key_id=key_id)
+
+    def mint(self, uid, email=None, name=None, lifetime=3600):
+        """Return a signed ID token for ``uid`` shaped like a Firebase one."""
+        now = int(time.time())
+        payload = {
+            'iss': ID_TOKEN_ISSUER_PREFIX + self.project_id,
+            'aud': self.project_id,
+            'auth_time': now,
+            'sub': uid,
+            'user_id': uid,
+            'iat': now,
+            'exp': now + lifetime,
+        }
+        if email:
+            payload['email'] = email
+        if name:
+            payload['name'] = name
+        return jwt.encode(self._signer, payload).decode('utf-8')
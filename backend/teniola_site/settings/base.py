@@ -73,6 +73,22 @@ AUTH_PASSWORD_VALIDATORS = [
 # -----------------------------------------------------------------------------
 FIREBASE_SERVICE_ACCOUNT_KEY_PATH = os.path.join(BASE_DIR, "core/firebase_service_account.json")
 
+# Verified ID tokens are cached per worker until they expire; rejected tokens
+# are remembered for FIREBASE_TOKEN_NEGATIVE_TTL seconds.
+FIREBASE_TOKEN_CACHE_SIZE = int(os.getenv("FIREBASE_TOKEN_CACHE_SIZE", "1024"))
+FIREBASE_TOKEN_NEGATIVE_TTL = int(os.getenv("FIREBASE_TOKEN_NEGATIVE_TTL", "30"))
+
+# Google's token signing certificates are cached on disk and refreshed in the
+# background FIREBASE_CERTS_REFRESH_MARGIN seconds before they expire.
+FIREBASE_CERTS_CACHE_PATH = os.getenv("FIREBASE_CERTS_CACHE_PATH") or None
+FIREBASE_CERTS_REFRESH_MARGIN = int(os.getenv("FIREBASE_CERTS_REFRESH_MARGIN", "300"))
+
+# Verify tokens against a local {key id: certificate} JSON file instead of
+# Google's certificates (offline testing and benchmarking). Without a service
+# account, FIREBASE_PROJECT_ID must match the "aud" of the local tokens.
+FIREBASE_LOCAL_CERTS_PATH = os.getenv("FIREBASE_LOCAL_CERTS_PATH") or None
+FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "teniola_site.firebase_authentication.FirebaseAuthentication",
@@ -80,13 +96,36 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ),
+    # orjson-backed drop-ins for JSONRenderer/JSONParser (stdlib json if orjson is missing)
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "api.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
 }
 
+# Response headers the frontend may read cross-origin
+CORS_EXPOSE_HEADERS = [
+    "ETag", "X-Estimated-Count", "Upload-Offset", "Idempotent-Replayed",
+    "Retry-After", "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy",
+]
+
+# -----------------------------------------------------------------------------
+# API CACHE
+# -----------------------------------------------------------------------------
+# Public list responses are cached until an admin edits the underlying content
+# (see api/cache.py). Uses the "default" cache: locmem unless overridden.
+API_CACHE_TIMEOUT = int(os.getenv("API_CACHE_TIMEOUT", str(60 * 60 * 24)))
+
+# Seconds an authenticated request's AdminUser lookup is shared across
+# requests; any AdminUser/AdminRole change invalidates it immediately.
+ADMIN_USER_CACHE_TIMEOUT = int(os.getenv("ADMIN_USER_CACHE_TIMEOUT", "60"))
+
 # -----------------------------------------------------------------------------
 # STATIC & MEDIA FILES
 # -----------------------------------------------------------------------------
@@ -96,6 +135,98 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Internal nginx location MEDIA_URL requests are redirected to with
+# X-Accel-Redirect; unset, media is served by Django (see api/media.py).
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX") or None
+
+# Uploads are stored under the hash of their content (see api/storage.py)
+STORAGES = {
+    "default": {"BACKEND": "api.storage.ContentAddressedStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Uploaded images are re-encoded at these widths in these formats (see
+# api/images.py); formats this Pillow build can't encode are skipped.
+IMAGE_VARIANT_WIDTHS = [320, 640, 1024, 1600]
+IMAGE_VARIANT_FORMATS = ["avif", "webp"]
+# Process uploads on a background worker pool; False processes them inline
+IMAGE_PROCESSING_ASYNC = os.getenv("IMAGE_PROCESSING_ASYNC", "True").lower() == "true"
+IMAGE_PROCESSING_WORKERS = int(os.getenv("IMAGE_PROCESSING_WORKERS", "2"))
+
+# Resumable chunked uploads (see api/uploads.py): chunks are assembled here,
+# outside MEDIA_ROOT, and abandoned uploads are dropped after the expiry.
+CHUNKED_UPLOAD_DIR = Path(os.getenv("CHUNKED_UPLOAD_DIR", BASE_DIR / "tmp" / "uploads"))
+CHUNKED_UPLOAD_MAX_SIZE = int(os.getenv("CHUNKED_UPLOAD_MAX_SIZE", str(100 * 1024 * 1024)))
+CHUNKED_UPLOAD_EXPIRY = int(os.getenv("CHUNKED_UPLOAD_EXPIRY", str(60 * 60 * 24)))
+
+# Queue contact form submissions in a local journal and store them in batches
+# from a background thread (see api/ingest.py); POST /api/contacts/ then
+# answers 202 with a ticket instead of 201.
+CONTACT_QUEUE_ENABLED = os.getenv("CONTACT_QUEUE_ENABLED", "False").lower() == "true"
+CONTACT_QUEUE_PATH = Path(os.getenv("CONTACT_QUEUE_PATH", BASE_DIR / "tmp" / "contact_queue.sqlite3"))
+# Submissions waiting beyond this answer 503 with Retry-After
+CONTACT_QUEUE_MAX_PENDING = int(os.getenv("CONTACT_QUEUE_MAX_PENDING", "10000"))
+CONTACT_QUEUE_BATCH_SIZE = 500
+# Seconds between drain passes when nothing wakes the worker
+CONTACT_QUEUE_POLL_INTERVAL = 5
+# Seconds before a batch claimed by a worker that died is claimed again
+CONTACT_QUEUE_CLAIM_TIMEOUT = 60
+CONTACT_QUEUE_MAX_ATTEMPTS = 5
+# Seconds stored submissions stay readable through the status endpoint
+CONTACT_QUEUE_RETENTION = 60 * 60 * 24 * 7
+
+# Notifications (see api/outbox.py) are written to an outbox table with the
+# change they report and sent by a background thread, never in the request.
+SITE_URL = os.getenv("SITE_URL", "http://localhost:5173")
+# Who is emailed about new contact messages (comma separated)
+NOTIFICATION_EMAILS = [email.strip() for email in os.getenv("NOTIFICATION_EMAILS", "").split(",") if email.strip()]
+# Every event is also POSTed here, signed with the secret if one is set
+NOTIFICATION_WEBHOOK_URL = os.getenv("NOTIFICATION_WEBHOOK_URL") or None
+NOTIFICATION_WEBHOOK_SECRET = os.getenv("NOTIFICATION_WEBHOOK_SECRET") or None
+NOTIFICATIONS_ASYNC = os.getenv("NOTIFICATIONS_ASYNC", "True").lower() == "true"
+NOTIFICATION_BATCH_SIZE = 50
+NOTIFICATION_POLL_INTERVAL = 10
+# Seconds a worker has to send a batch before another worker may take it
+NOTIFICATION_LEASE = 120
+NOTIFICATION_TIMEOUT = 10
+NOTIFICATION_MAX_ATTEMPTS = 8
+# Retries wait RETRY_BASE * 2 ** (attempts - 1) seconds, up to RETRY_MAX
+NOTIFICATION_RETRY_BASE = 30
+NOTIFICATION_RETRY_MAX = 60 * 60
+# Seconds sent messages are kept
+NOTIFICATION_RETENTION = 60 * 60 * 24 * 7
+
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "False").lower() == "true"
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "webmaster@localhost")
+
+# Score new contact messages for spam on a background thread (see
+# api/spam.py); False scores them inline after the commit
+SPAM_SCORING_ASYNC = os.getenv("SPAM_SCORING_ASYNC", "True").lower() == "true"
+
+# Token buckets per rate-limited view (see api/ratelimit.py):
+# "<ip|key>:<requests>/<period>", refilled evenly over the period.
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+RATE_LIMITS = {
+    "contact": ["ip:5/m", "ip:30/h", "key:5/h"],
+    "accept-invitation": ["ip:10/m", "key:5/m"],
+    "validate-invitation": ["ip:30/m", "key:10/m"],
+}
+# request.META entry holding the client address
+RATE_LIMIT_IP_META_KEY = os.getenv("RATE_LIMIT_IP_META_KEY", "REMOTE_ADDR")
+
+# Responses to requests with an Idempotency-Key header are replayed to
+# retries for this many seconds (see api/idempotency.py)
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", str(60 * 60 * 24)))
+# Seconds a retry waits for an attempt that is still running, and after
+# which an attempt whose worker died stops blocking its key
+IDEMPOTENCY_WAIT = 10
+IDEMPOTENCY_LOCK_TIMEOUT = 60
+
 # -----------------------------------------------------------------------------
 # MISC
 # -----------------------------------------------------------------------------
@@ -50,6 +50,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Background workers write too: take the write lock when a transaction
+        # starts, so writers wait for each other instead of failing as locked
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
     }
 }
 
@@ -65,7 +68,10 @@ CORS_ALLOW_HEADERS = [
     "authorization",
     "content-type",
     "dnt",
+    "idempotency-key",
     "origin",
+    "upload-checksum",
+    "upload-offset",
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
@@ -79,6 +79,9 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # Background workers write too: take the write lock when a transaction
+            # starts, so writers wait for each other instead of failing as locked
+            "OPTIONS": {"transaction_mode": "IMMEDIATE"},
         }
     }
 
@@ -101,7 +104,10 @@ CORS_ALLOW_HEADERS = [
     "authorization",
     "content-type",
     "dnt",
+    "idempotency-key",
     "origin",
+    "upload-checksum",
+    "upload-offset",
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
@@ -150,6 +156,24 @@ CACHES = {
     }
 }
 
+# -----------------------------------------------------------------------------
+# MEDIA FILES
+# -----------------------------------------------------------------------------
+# nginx sends media files from its internal /protected-media/ location
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/") or None
+
+# -----------------------------------------------------------------------------
+# NOTIFICATIONS
+# -----------------------------------------------------------------------------
+SITE_URL = os.getenv("SITE_URL", "https://teniolaokunlola.com")
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+
+# -----------------------------------------------------------------------------
+# RATE LIMITING
+# -----------------------------------------------------------------------------
+# gunicorn is only reachable through nginx, which sets X-Real-IP to the client
+RATE_LIMIT_IP_META_KEY = os.getenv("RATE_LIMIT_IP_META_KEY", "HTTP_X_REAL_IP")
+
 # -----------------------------------------------------------------------------
 # SESSION CONFIGURATION
 # -----------------------------------------------------------------------------
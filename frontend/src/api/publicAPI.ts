@@ -1,11 +1,28 @@
 import { buildApiUrl } from './config';
 
 // Types for public API responses (same as backend models but for public consumption)
+
+// Resized AVIF/WebP copies of an uploaded image and its intrinsic size,
+// dominant color and a tiny data: URI placeholder
+export interface ImageVariants {
+  status?: 'pending' | 'ready' | 'failed';
+  width?: number;
+  height?: number;
+  color?: string;
+  placeholder?: string;
+  sources?: {
+    type: string;
+    width: number;
+    height: number;
+    url: string;
+  }[];
+}
 export interface PublicProject {
   id: number;
   title: string;
   description: string;
   image?: string;
+  image_variants?: ImageVariants;
   url?: string;
   tags?: string[];
   created_at: string;
@@ -23,6 +40,8 @@ export interface PublicExperience {
   id: number;
   job_title: string;
   company: string;
+  company_logo?: string;
+  company_logo_variants?: ImageVariants;
   start_date: string;
   end_date?: string;
   description: string;
@@ -47,6 +66,7 @@ export interface PublicAbout {
   last_name: string;
   title? : string;
   profile_picture?: string;
+  profile_picture_variants?: ImageVariants;
   summary: string;
   email?: string;
   phone_number?: string;
@@ -59,6 +79,7 @@ export interface PublicTestimonial {
   name: string;
   feedback: string;
   image?: string;
+  image_variants?: ImageVariants;
   created_at: string;
   company?: string;
   position?: string;
@@ -76,7 +97,9 @@ export interface PublicSetting {
   id: number;
   site_name: string;
   site_logo?: string;
+  site_logo_variants?: ImageVariants;
   site_favicon?: string;
+  site_favicon_variants?: ImageVariants;
   site_description: string;
   site_keywords: string;
   site_author: string;
@@ -110,6 +133,20 @@ export interface PublicService {
   updated_at: string;
 }
 
+export interface PublicPortfolio {
+  about: PublicAbout[];
+  projects: PublicProject[];
+  skills: PublicSkill[];
+  testimonials: PublicTestimonial[];
+  services: PublicService[];
+  experiences: PublicExperience[];
+  educations: PublicEducation[];
+  sociallinks: PublicSocialLink[];
+  settings: PublicSetting[];
+}
+
+export type PortfolioSection = keyof PublicPortfolio;
+
 export interface ContactFormData {
   name: string;
   email: string;
@@ -124,8 +161,9 @@ function withSlash(url: string): string {
 // Public API class for client-side consumption
 export class PublicAPI {
   // Generic fetch method for public endpoints
-  private static async fetchPublic<T>(endpoint: string): Promise<T> {
-    const response = await fetch(buildApiUrl(withSlash(endpoint)));
+  private static async fetchPublic<T>(endpoint: string, query?: URLSearchParams): Promise<T> {
+    const qs = query && query.toString() ? `?${query.toString()}` : '';
+    const response = await fetch(buildApiUrl(withSlash(endpoint)) + qs);
     if (!response.ok) {
       throw new Error(`Failed to fetch ${endpoint}: ${response.statusText}`);
     }
@@ -185,6 +223,15 @@ export class PublicAPI {
     list: () => this.fetchPublic<PublicService[]>('services'),
   };
 
+  // All public sections in a single request (optionally limited to a subset)
+  static portfolio = {
+    get: (sections?: PortfolioSection[]) =>
+      this.fetchPublic<PublicPortfolio>(
+        'portfolio',
+        sections && sections.length ? new URLSearchParams({ sections: sections.join(',') }) : undefined
+      ),
+  };
+
   // Contact form submission
   static contact = {
     create: (data: ContactFormData) => this.postPublic<{ message: string }>('contacts', data),
@@ -0,0 +1,30 @@
+import type { CSSProperties } from 'react';
+import type { ImageVariants } from '@/api/publicAPI';
+
+/**
+ * <source> attributes for the processed variants of an image, one per
+ * format (AVIF first), for use inside a <picture> whose <img> keeps the
+ * original upload as the fallback.
+ */
+export function variantSources(variants?: ImageVariants): { type: string; srcSet: string }[] {
+  const byType = new Map<string, string[]>();
+  for (const source of variants?.sources ?? []) {
+    const candidates = byType.get(source.type) ?? [];
+    candidates.push(`${source.url} ${source.width}w`);
+    byType.set(source.type, candidates);
+  }
+  return Array.from(byType, ([type, candidates]) => ({ type, srcSet: candidates.join(', ') }));
+}
+
+/**
+ * Background for an image's container: the dominant color and the blurred
+ * placeholder, shown until the image itself has loaded over it.
+ */
+export function placeholderStyle(variants?: ImageVariants): CSSProperties {
+  return {
+    backgroundColor: variants?.color,
+    backgroundImage: variants?.placeholder ? `url("${variants.placeholder}")` : undefined,
+    backgroundSize: 'cover',
+    backgroundPosition: 'center',
+  };
+}
@@ -25,6 +25,7 @@ import {
   RateLimiter 
 } from '@/lib/security';
 import { logger } from '@/lib/logger';
+import { placeholderStyle, variantSources } from '@/lib/images';
 import { getErrorMessage } from '@/types/errors';
 import mainImage from '@/assets/main.jpg';
 
@@ -130,36 +131,16 @@ const Home: React.FC = () => {
     let mounted = true;
     setLoading(true);
     setError(null);
-    Promise.all([
-      PublicAPI.about.list(),
-      PublicAPI.projects.list(),
-      PublicAPI.skills.list(),
-      PublicAPI.testimonials.list(),
-      PublicAPI.services.list(),
-      PublicAPI.experience.list(),
-      PublicAPI.education.list(),
-      PublicAPI.socialLinks.list(),
-      PublicAPI.settings.list(),
-    ])
-      .then(([ 
-        aboutData,
-        projectsData,
-        skillsData,
-        testimonialsData,
-        servicesData,
-        experienceData,
-        educationData,
-        _socialLinksData,
-        _settingsData,
-      ]) => {
+    PublicAPI.portfolio.get()
+      .then((data) => {
         if (mounted) {
-          setAbout(aboutData[0] || null);
-          setProjects(projectsData);
-          setSkills(skillsData);
-          setTestimonials(testimonialsData);
-          setServices(servicesData);
-          setExperience(experienceData);
-          setEducation(educationData);
+          setAbout(data.about[0] || null);
+          setProjects(data.projects);
+          setSkills(data.skills);
+          setTestimonials(data.testimonials);
+          setServices(data.services);
+          setExperience(data.experiences);
+          setEducation(data.educations);
           // Note: socialLinks and settings are not used in the current UI
         }
       })
@@ -465,11 +446,19 @@ const Home: React.FC = () => {
                       whileHover={{ scale: 1.05, borderColor: "rgba(139, 92, 246, 0.8)" }}
                       transition={{ duration: 0.3 }}
                     >
-                      <img
-                        src={about?.profile_picture || mainImage}
-                        alt={about?.full_name || "Profile"}
-                        className="w-full h-full object-cover"
-                      />
+                      <picture>
+                        {about?.profile_picture && variantSources(about.profile_picture_variants).map((source) => (
+                          <source key={source.type} type={source.type} srcSet={source.srcSet} sizes="(min-width: 1024px) 384px, (min-width: 768px) 320px, (min-width: 640px) 256px, 192px" />
+                        ))}
+                        <img
+                          src={about?.profile_picture || mainImage}
+                          alt={about?.full_name || "Profile"}
+                          width={about?.profile_picture_variants?.width}
+                          height={about?.profile_picture_variants?.height}
+                          className="w-full h-full object-cover"
+                          style={about?.profile_picture ? placeholderStyle(about.profile_picture_variants) : undefined}
+                        />
+                      </picture>
                     </motion.div>
                     <motion.div 
                       className="absolute -bottom-2 -right-2 sm:-bottom-4 sm:-right-4 w-12 h-12 sm:w-16 sm:h-16 md:w-20 md:h-20 bg-gradient-to-br from-purple-600 to-purple-500 rounded-full shadow-lg flex items-center justify-center border-4 border-background"
@@ -789,13 +778,21 @@ const Home: React.FC = () => {
                 >
                   <Card className="bg-card/50 border-border rounded-lg hover:border-purple-500/50 overflow-hidden group backdrop-blur-sm transition-all duration-300 h-full p-0">
                     {project.image && (
-                      <div className="aspect-[2/3] overflow-hidden relative">
-                        <motion.img
-                          src={project.image}
-                          alt={project.title}
-                          className="w-full h-full object-cover transition-transform duration-500"
-                          whileHover={{ scale: 1.05 }}
-                        />
+                      <div className="aspect-[2/3] overflow-hidden relative" style={placeholderStyle(project.image_variants)}>
+                        <picture>
+                          {variantSources(project.image_variants).map((source) => (
+                            <source key={source.type} type={source.type} srcSet={source.srcSet} sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw" />
+                          ))}
+                          <motion.img
+                            src={project.image}
+                            alt={project.title}
+                            width={project.image_variants?.width}
+                            height={project.image_variants?.height}
+                            loading="lazy"
+                            className="w-full h-full object-cover transition-transform duration-500"
+                            whileHover={{ scale: 1.05 }}
+                          />
+                        </picture>
                         <div className="absolute inset-0 bg-gradient-to-t from-purple-900/50 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300" />
                       </div>
                     )}
@@ -1172,13 +1169,22 @@ const Home: React.FC = () => {
                           
                           <div className="flex items-center gap-2 mt-auto">
                             {testimonial.image && (
-                            <motion.img
-                              src={testimonial.image}
-                              alt={testimonial.name}
-                              className="w-12 h-12 rounded-full object-cover border-2 border-purple-500/30"
-                              whileHover={{ scale: 1.1, borderColor: "rgba(139, 92, 246, 0.8)" }}
-                              transition={{ duration: 0.3 }}
-                            />
+                            <picture>
+                              {variantSources(testimonial.image_variants).map((source) => (
+                                <source key={source.type} type={source.type} srcSet={source.srcSet} sizes="48px" />
+                              ))}
+                              <motion.img
+                                src={testimonial.image}
+                                alt={testimonial.name}
+                                width={testimonial.image_variants?.width}
+                                height={testimonial.image_variants?.height}
+                                loading="lazy"
+                                className="w-12 h-12 rounded-full object-cover border-2 border-purple-500/30"
+                                style={placeholderStyle(testimonial.image_variants)}
+                                whileHover={{ scale: 1.1, borderColor: "rgba(139, 92, 246, 0.8)" }}
+                                transition={{ duration: 0.3 }}
+                              />
+                            </picture>
                           )}
                           <div>
                             <div className="text-sm text-foreground">{testimonial.name}</div>